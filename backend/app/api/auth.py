@@ -1,10 +1,18 @@
 from datetime import datetime, timedelta
+import asyncio
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth import hash_password, verify_password, create_access_token, get_current_user, require_admin
+from app.auth import (
+    hash_password,
+    verify_password,
+    password_needs_rehash,
+    create_access_token,
+    get_current_user,
+    require_admin,
+)
 from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
@@ -15,6 +23,7 @@ from app.schemas.auth import (
     AuthResponse,
     UserResponse,
 )
+from app.services import http_client
 
 router = APIRouter()
 
@@ -40,7 +49,8 @@ async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
     user = User(
         email=body.email,
         name=body.name,
-        hashed_password=hash_password(body.password),
+        # Hashing is deliberately slow; keep it off the event loop
+        hashed_password=await asyncio.to_thread(hash_password, body.password),
         login_count=1,
         last_login_at=datetime.utcnow(),
     )
@@ -63,12 +73,16 @@ async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
             detail="Invalid email or password",
         )
 
-    if not verify_password(body.password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, body.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    # Upgrade legacy bcrypt hashes; committed along with the login bump
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await asyncio.to_thread(hash_password, body.password)
+
     await _record_login(user, db)
     token = create_access_token(user.id, user.email)
     return AuthResponse(token=token, user=UserResponse.model_validate(user))
@@ -77,15 +91,12 @@ async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
 @router.post("/google", response_model=AuthResponse)
 async def google_auth(body: GoogleAuthRequest, db: AsyncSession = Depends(get_db)):
     """Authenticate with Google ID token (from Sign In With Google button)."""
-    import httpx
-
     settings = get_settings()
 
     # Verify the Google ID token
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"https://oauth2.googleapis.com/tokeninfo?id_token={body.credential}"
-        )
+    resp = await http_client.get_client().get(
+        f"https://oauth2.googleapis.com/tokeninfo?id_token={body.credential}"
+    )
 
     if resp.status_code != 200:
         raise HTTPException(
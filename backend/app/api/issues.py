@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-import httpx
 
 from app.auth import get_current_user
 from app.config import get_settings
 from app.models.user import User
+from app.services import http_client
 
 router = APIRouter()
 
@@ -40,20 +40,19 @@ async def create_issue(
         f"Submitted by **{user.name}** via the app"
     )
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            f"https://api.github.com/repos/{settings.github_repo}/issues",
-            headers={
-                "Authorization": f"Bearer {settings.github_token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            },
-            json={
-                "title": f"[{label}] {body.title}",
-                "body": issue_body,
-                "labels": [label],
-            },
-        )
+    resp = await http_client.get_client().post(
+        f"https://api.github.com/repos/{settings.github_repo}/issues",
+        headers={
+            "Authorization": f"Bearer {settings.github_token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        json={
+            "title": f"[{label}] {body.title}",
+            "body": issue_body,
+            "labels": [label],
+        },
+    )
 
     if resp.status_code != 201:
         raise HTTPException(
@@ -0,0 +1,188 @@
+"""
+Store for background scrape jobs.
+
+Running jobs live in ``active_jobs``; when their task ends they move to
+``recent_jobs``, which keeps the last ``RECENT_JOBS_MAX`` in finish order and
+evicts the oldest first.
+
+Every job is also snapshotted to the ``scrape_jobs`` table — every
+``PERSIST_INTERVAL`` seconds while it runs and once more when it ends — so
+``/status`` still answers after a restart (or from another worker).
+Finished rows expire after a day (completed) or a week (anything else).
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select
+
+from app.database import async_session
+from app.models.scrape_job import ScrapeJob
+
+logger = logging.getLogger(__name__)
+
+active_jobs: Dict[str, Dict[str, Any]] = {}
+recent_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+tasks: Dict[str, asyncio.Task] = {}
+job_keys: Dict[str, str] = {}  # job_id -> dedup key, while the job runs
+RECENT_JOBS_MAX = 200
+
+PERSIST_INTERVAL = 2.0  # seconds between snapshots of a running job
+STALE_AFTER = timedelta(seconds=60)  # running row not refreshed -> its process died
+COMPLETED_TTL = timedelta(hours=24)
+FAILED_TTL = timedelta(days=7)
+
+
+def _utc(dt: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back naive
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def create_job(markets_label: str, dedup_key: Optional[str] = None) -> str:
+    """Create a new job entry and return the job_id."""
+    job_id = str(uuid.uuid4())
+    active_jobs[job_id] = {
+        "status": "in_progress",
+        "message": f"Starting {markets_label} scrape...",
+        "matches_found": 0,
+        "matches_completed": 0,
+        "current_match": None,
+        "results": [],
+    }
+    if dedup_key is not None:
+        job_keys[job_id] = dedup_key
+    return job_id
+
+
+async def claim_job(markets_label: str, dedup_key: str) -> str:
+    """Create a job unless one with the same ``dedup_key`` is already running.
+
+    Raises:
+        HTTPException: 409 if a live job (here or in scrape_jobs) holds the key.
+    """
+    running = False
+    try:
+        async with async_session() as db:
+            running = await db.scalar(
+                select(ScrapeJob.id)
+                .where(
+                    ScrapeJob.dedup_key == dedup_key,
+                    ScrapeJob.status == "in_progress",
+                    ScrapeJob.updated_at > datetime.now(timezone.utc) - STALE_AFTER,
+                )
+                .limit(1)
+            ) is not None
+    except Exception as e:
+        logger.warning(f"Could not check scrape_jobs for {dedup_key}: {e}")
+
+    # No awaits from here to create_job, so two requests can't both pass
+    running = running or any(
+        key == dedup_key and jid in active_jobs for jid, key in job_keys.items()
+    )
+    if running:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A scrape for {dedup_key} is already running",
+        )
+    return create_job(markets_label, dedup_key)
+
+
+def start_job(job_id: str, coro) -> None:
+    """Run a job's coroutine as a background task and retire the job when it ends."""
+    task = asyncio.create_task(_run_tracked(job_id, coro))
+    tasks[job_id] = task
+    task.add_done_callback(lambda _: finish_job(job_id))
+
+
+def finish_job(job_id: str) -> None:
+    """Move a job from the active set to the bounded recent-jobs history."""
+    job_keys.pop(job_id, None)
+    job = active_jobs.pop(job_id, None)
+    if job is None:
+        return
+    recent_jobs[job_id] = job
+    while len(recent_jobs) > RECENT_JOBS_MAX:
+        old_id, _ = recent_jobs.popitem(last=False)
+        tasks.pop(old_id, None)
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Look a job up whether it's still running or recently finished."""
+    return active_jobs.get(job_id) or recent_jobs.get(job_id)
+
+
+async def load_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a job's last persisted state (for jobs this process doesn't hold)."""
+    try:
+        async with async_session() as db:
+            row = await db.get(ScrapeJob, job_id)
+    except Exception as e:
+        logger.warning(f"Could not load scrape job {job_id}: {e}")
+        return None
+    if row is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    if row.expires_at is not None and _utc(row.expires_at) < now:
+        return None
+    job = dict(row.state)
+    if row.status == "in_progress" and _utc(row.updated_at) < now - STALE_AFTER:
+        job["status"] = "failed"
+        job["message"] = "Scrape was interrupted (server restarted)"
+    return job
+
+
+def latest_finished() -> Optional[Dict[str, Any]]:
+    """The most recently finished job (with its job_id), if any."""
+    if not recent_jobs:
+        return None
+    job_id, job = next(reversed(recent_jobs.items()))
+    return {"job_id": job_id, **job}
+
+
+async def _run_tracked(job_id: str, coro):
+    job = active_jobs[job_id]
+    heartbeat = asyncio.create_task(_heartbeat(job_id, job))
+    try:
+        await coro
+    finally:
+        heartbeat.cancel()
+        await _persist(job_id, job, final=True)
+
+
+async def _heartbeat(job_id: str, job: Dict[str, Any]):
+    while True:
+        await _persist(job_id, job)
+        await asyncio.sleep(PERSIST_INTERVAL)
+
+
+async def _persist(job_id: str, job: Dict[str, Any], final: bool = False):
+    now = datetime.now(timezone.utc)
+    job_status = job.get("status", "in_progress")
+    expires_at = None
+    if final:
+        expires_at = now + (COMPLETED_TTL if job_status == "completed" else FAILED_TTL)
+    try:
+        # Round-trip through JSON: a stable snapshot the task can't mutate
+        # mid-flush, with dates and Decimals stringified
+        state = json.loads(json.dumps(job, default=str))
+        async with async_session() as db:
+            await db.merge(ScrapeJob(
+                id=job_id,
+                dedup_key=job_keys.get(job_id),
+                status=job_status,
+                state=state,
+                updated_at=now,
+                expires_at=expires_at,
+            ))
+            if final:
+                await db.execute(delete(ScrapeJob).where(ScrapeJob.expires_at < now))
+            await db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to persist scrape job {job_id}: {e}")
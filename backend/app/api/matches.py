@@ -1,10 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date, datetime
+from functools import lru_cache
+import time
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy import select, func, case, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.streaming import dump_json
 from app.database import get_db
 from app.models.odds import MatchOdds, Odds
 from app.models.player import Player
@@ -18,7 +21,6 @@ from app.schemas.match import (
     MatchResponse,
     MatchTryScorer,
     CurrentRoundResponse,
-    MatchScrapeStatus,
     RoundScrapeStatusResponse,
     TryScorerDetail,
     MarketStatus,
@@ -34,20 +36,48 @@ router = APIRouter()
 # Six Nations schedule: rounds are typically weeks apart in Feb-Mar
 SIX_NATIONS_ROUNDS = 5
 
+# /status runs ~30 queries and every open dashboard polls it, so the encoded
+# body is shared for ROUND_STATUS_CACHE_TTL seconds per (season, round).
+# Scrapes recorded in this process clear it straight away; writes from the
+# standalone scripts show up once the entry expires. The key comes from the
+# query string, so expired entries are pruned and the size is capped.
+ROUND_STATUS_CACHE_TTL = 10
+ROUND_STATUS_CACHE_MAX = 32
+_round_status_cache: dict[Tuple[int, int], Tuple[bytes, float]] = {}
+
+
+def invalidate_round_status_cache():
+    """Drop cached /status bodies (call after writing scrape data)."""
+    _round_status_cache.clear()
+
+
+def _cache_round_status(key: Tuple[int, int], body: bytes, now: float):
+    for stale in [k for k, (_, expires) in _round_status_cache.items() if expires <= now]:
+        del _round_status_cache[stale]
+    _round_status_cache.pop(key, None)
+    while len(_round_status_cache) >= ROUND_STATUS_CACHE_MAX:
+        del _round_status_cache[next(iter(_round_status_cache))]  # oldest first
+    _round_status_cache[key] = (body, now + ROUND_STATUS_CACHE_TTL)
+
+
+@lru_cache(maxsize=32)
+def _current_round_body(season: int, current: int) -> bytes:
+    return dump_json(CurrentRoundResponse(season=season, round=current).model_dump())
+
 
 @router.get("/current-round", response_model=CurrentRoundResponse)
-async def get_current_round(
-    season: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
-):
+async def get_current_round(season: Optional[int] = None):
     """
     Determine the current active round from the hardcoded schedule.
 
     Uses fixture kickoff times to find the earliest round with unplayed matches.
+    The schedule is static, so the encoded body is cached per (season, round).
     """
     target_season = season or date.today().year
     current = fixtures_current_round(target_season)
-    return CurrentRoundResponse(season=target_season, round=current)
+    return Response(
+        content=_current_round_body(target_season, current), media_type="application/json",
+    )
 
 
 @router.get("/status", response_model=RoundScrapeStatusResponse)
@@ -60,6 +90,20 @@ async def get_round_scrape_status(
     Report which markets have been scraped for each match in a round.
     Uses hardcoded schedule as the base, enriched with DB data.
     """
+    key = (season, game_round)
+    cached = _round_status_cache.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return Response(content=cached[0], media_type="application/json")
+
+    response = await _build_round_scrape_status(season, game_round, db)
+    body = response.model_dump_json().encode("utf-8")
+    _cache_round_status(key, body, time.monotonic())
+    return Response(content=body, media_type="application/json")
+
+
+async def _build_round_scrape_status(
+    season: int, game_round: int, db: AsyncSession,
+) -> RoundScrapeStatusResponse:
     fixtures = get_round_fixtures(season, game_round)
 
     # Build lookup of DB odds keyed by (home, away)
@@ -72,7 +116,6 @@ async def get_round_scrape_status(
         (m.home_team, m.away_team): m for m in result.scalars().all()
     }
 
-    match_statuses = []
     enriched_match_data = []  # Collect per-match data for validation
     for home, away, kickoff in fixtures:
         match = odds_by_match.get((home, away))
@@ -153,18 +196,6 @@ async def get_round_scrape_status(
         # MatchOdds.scraped_at applies to both handicaps and totals
         match_odds_scraped_at = match.scraped_at if match and match.scraped_at else None
 
-        match_statuses.append(
-            MatchScrapeStatus(
-                home_team=home,
-                away_team=away,
-                match_date=kickoff.date(),
-                has_handicap=has_handicap,
-                has_totals=has_totals,
-                has_try_scorer=try_scorer_count > 0,
-                try_scorer_count=try_scorer_count,
-            )
-        )
-
         # Collect data for validation and enriched response
         enriched_match_data.append({
             "home_team": home,
@@ -182,33 +213,26 @@ async def get_round_scrape_status(
             "players_with_odds": players_with_odds,
         })
 
-    # Query fantasy prices for this round
+    # Fantasy prices for this round: row count, rows with availability info
+    # (COUNT(col) skips NULLs) and latest import, in one pass
     price_result = await db.execute(
-        select(func.count()).select_from(FantasyPrice)
-        .where(FantasyPrice.season == season, FantasyPrice.round == game_round)
-    )
-    price_count = price_result.scalar() or 0
-
-    # Count players with/without availability info
-    avail_known_result = await db.execute(
-        select(func.count()).select_from(FantasyPrice)
-        .where(
-            FantasyPrice.season == season,
-            FantasyPrice.round == game_round,
-            FantasyPrice.availability.isnot(None),
+        select(
+            func.count(),
+            func.count(FantasyPrice.availability),
+            func.max(FantasyPrice.created_at),
         )
+        .where(FantasyPrice.season == season, FantasyPrice.round == game_round)
     )
-    availability_known = avail_known_result.scalar() or 0
-    availability_unknown = price_count - availability_known
+    price_count, availability_known, price_scraped_at = price_result.one()
 
     # Determine which markets are globally missing
     missing_markets = []
-    if match_statuses:
-        if not all(m.has_handicap for m in match_statuses):
+    if enriched_match_data:
+        if not all(md["has_handicap"] for md in enriched_match_data):
             missing_markets.append("handicaps")
-        if not all(m.has_totals for m in match_statuses):
+        if not all(md["has_totals"] for md in enriched_match_data):
             missing_markets.append("totals")
-        if not all(m.has_try_scorer for m in match_statuses):
+        if not all(md["has_try_scorer"] for md in enriched_match_data):
             missing_markets.append("try_scorer")
     else:
         # No matches at all — everything is missing
@@ -219,25 +243,12 @@ async def get_round_scrape_status(
 
     # --- Enriched data: dataset timestamps ---
 
-    # Fantasy prices: MAX(created_at) for this round
-    price_ts_result = await db.execute(
-        select(func.max(FantasyPrice.created_at))
-        .where(FantasyPrice.season == season, FantasyPrice.round == game_round)
-    )
-    price_scraped_at = price_ts_result.scalar()
-
-    # Fantasy stats: MAX(scraped_at) for this round
-    stats_ts_result = await db.execute(
-        select(func.max(FantasyRoundStats.scraped_at))
+    # Fantasy stats: row count and MAX(scraped_at) for this round
+    stats_result = await db.execute(
+        select(func.count(), func.max(FantasyRoundStats.scraped_at))
         .where(FantasyRoundStats.season == season, FantasyRoundStats.round == game_round)
     )
-    stats_scraped_at = stats_ts_result.scalar()
-
-    stats_count_result = await db.execute(
-        select(func.count()).select_from(FantasyRoundStats)
-        .where(FantasyRoundStats.season == season, FantasyRoundStats.round == game_round)
-    )
-    stats_count = stats_count_result.scalar() or 0
+    stats_count, stats_scraped_at = stats_result.one()
 
     # --- Scrape history ---
     scrape_runs_result = await db.execute(
@@ -354,8 +365,7 @@ async def get_round_scrape_status(
             status=sr.status,
             started_at=sr.started_at,
             completed_at=sr.completed_at,
-            duration_seconds=sr.duration_seconds,
-            warnings=sr.warnings,
+            warnings=sr.warnings or [],
             result_summary=sr.result_summary,
         )
         for sr in scrape_runs
@@ -364,12 +374,9 @@ async def get_round_scrape_status(
     return RoundScrapeStatusResponse(
         season=season,
         round=game_round,
-        matches=match_statuses,
         missing_markets=missing_markets,
-        has_prices=has_prices,
         price_count=price_count,
         availability_known=availability_known,
-        availability_unknown=availability_unknown,
         enriched_matches=enriched_matches,
         fantasy_prices=fantasy_prices_status,
         fantasy_stats=fantasy_stats_status,
@@ -1,9 +1,10 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
+from app.api.streaming import json_response
 from app.auth import require_admin
 from app.database import get_db
 from app.models import Player, FantasyPrice, TeamSelection, Prediction, Odds, PlayerClub
@@ -37,7 +38,12 @@ async def get_players(
     game_round: int = 1,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get list of players with optional filters"""
+    """Get list of players with optional filters
+
+    Rows are plain dicts encoded straight to JSON: the list covers every
+    player, and building a PlayerSummary per row only to serialise it again
+    was most of the response cost. PlayerSummary still documents the shape.
+    """
     query = select(Player).options(
         selectinload(Player.prices),
         selectinload(Player.predictions),
@@ -47,10 +53,10 @@ async def get_players(
     )
 
     if country:
-        query = query.where(Player.country == country.value)
+        query = query.where(Player.country == country)
 
     if position:
-        query = query.where(Player.fantasy_position == position.value)
+        query = query.where(Player.fantasy_position == position)
 
     result = await db.execute(query)
     players = result.scalars().all()
@@ -110,11 +116,11 @@ async def get_players(
         points_per_star = predicted_points / price if predicted_points and price else None
         value_score = points_per_star  # Simplified for now
 
-        summaries.append(PlayerSummary(
+        summaries.append(dict(
             id=player.id,
             name=player.name,
-            country=Country(player.country),
-            fantasy_position=Position(player.fantasy_position),
+            country=player.country,
+            fantasy_position=player.fantasy_position,
             club=club_record.club if club_record else None,
             league=club_record.league if club_record else None,
             price=price,
@@ -127,11 +133,57 @@ async def get_players(
             anytime_try_odds=anytime_try_odds,
         ))
 
-    return summaries
+    return json_response(summaries)
 
 
 FORWARD_POSITIONS = {"prop", "hooker", "second_row", "back_row"}
 
+_TOTAL_STATS = (
+    "tries", "tackles_made", "metres_carried",
+    "defenders_beaten", "turnovers_won", "offloads",
+)
+
+
+def _roster_ids(season: int, game_round: int):
+    """Subquery of player ids with a fantasy price for this round."""
+    return select(FantasyPrice.player_id).where(
+        FantasyPrice.season == season, FantasyPrice.round == game_round,
+    )
+
+
+async def _historical_totals(db: AsyncSession, player_ids) -> dict:
+    """Per-player game count and stat sums over Six Nations + club stats.
+
+    Summed in the database rather than loading every stat row as an ORM
+    object just to add up six integers.
+    """
+    totals: dict = {}
+    for model in (SixNationsStats, ClubStats):
+        columns = [func.count().label("games")] + [
+            func.sum(getattr(model, name)).label(name) for name in _TOTAL_STATS
+        ]
+        if model is SixNationsStats:
+            columns += [
+                func.sum(model.fantasy_points).label("fp_sum"),
+                func.count(model.fantasy_points).label("fp_games"),
+            ]
+        result = await db.execute(
+            select(model.player_id, *columns)
+            .where(model.player_id.in_(player_ids))
+            .group_by(model.player_id)
+        )
+        for row in result:
+            entry = totals.setdefault(
+                row.player_id, dict.fromkeys(("games", "fp_games", *_TOTAL_STATS), 0),
+            )
+            entry["games"] += row.games
+            for name in _TOTAL_STATS:
+                entry[name] += getattr(row, name) or 0
+            if model is SixNationsStats:
+                entry["fp_sum"] = float(row.fp_sum) if row.fp_games else None
+                entry["fp_games"] = row.fp_games
+    return totals
+
 
 @router.get("/value-analysis", response_model=List[PlayerValueAnalysis])
 async def get_value_analysis(
@@ -145,23 +197,29 @@ async def get_value_analysis(
     """
     Comprehensive player value analysis combining prices, odds, historical
     stats, and expected value calculations.
+
+    Only players priced for the round are loaded, their stat totals come
+    from grouped SQL aggregates, and rows are returned as plain dicts (the
+    response_model is kept for the OpenAPI schema).
     """
+    player_ids = select(Player.id).where(
+        Player.id.in_(_roster_ids(season, game_round))
+    )
+    if country:
+        player_ids = player_ids.where(Player.country == country)
+    if position:
+        player_ids = player_ids.where(Player.fantasy_position == position)
+
     query = select(Player).options(
         selectinload(Player.prices),
         selectinload(Player.odds),
         selectinload(Player.predictions),
         selectinload(Player.team_selections),
-        selectinload(Player.six_nations_stats),
-        selectinload(Player.club_stats),
-    )
-
-    if country:
-        query = query.where(Player.country == country.value)
-    if position:
-        query = query.where(Player.fantasy_position == position.value)
+    ).where(Player.id.in_(player_ids))
 
     result = await db.execute(query)
     players = result.scalars().all()
+    totals = await _historical_totals(db, player_ids)
 
     analyses = []
     for player in players:
@@ -207,17 +265,15 @@ async def get_value_analysis(
             is_starting = None
 
         # Historical stats aggregation (all Six Nations + club stats)
-        sn_stats = player.six_nations_stats or []
-        cl_stats = player.club_stats or []
-        total_games = len(sn_stats) + len(cl_stats)
+        player_totals = totals.get(player.id, {})
+        total_games = player_totals.get("games", 0)
 
-        # Aggregate across both stat types
-        total_tries = sum(s.tries for s in sn_stats) + sum(s.tries for s in cl_stats)
-        total_tackles = sum(s.tackles_made for s in sn_stats) + sum(s.tackles_made for s in cl_stats)
-        total_metres = sum(s.metres_carried for s in sn_stats) + sum(s.metres_carried for s in cl_stats)
-        total_db = sum(s.defenders_beaten for s in sn_stats) + sum(s.defenders_beaten for s in cl_stats)
-        total_to = sum(s.turnovers_won for s in sn_stats) + sum(s.turnovers_won for s in cl_stats)
-        total_offloads = sum(s.offloads for s in sn_stats) + sum(s.offloads for s in cl_stats)
+        total_tries = player_totals.get("tries", 0)
+        total_tackles = player_totals.get("tackles_made", 0)
+        total_metres = player_totals.get("metres_carried", 0)
+        total_db = player_totals.get("defenders_beaten", 0)
+        total_to = player_totals.get("turnovers_won", 0)
+        total_offloads = player_totals.get("offloads", 0)
 
         avg_tries = (total_tries / total_games) if total_games else None
         avg_tackles = (total_tackles / total_games) if total_games else None
@@ -227,10 +283,10 @@ async def get_value_analysis(
         avg_offloads = (total_offloads / total_games) if total_games else None
 
         # Fantasy points average (Six Nations only — club stats don't have fantasy_points)
-        sn_with_fp = [s for s in sn_stats if s.fantasy_points is not None]
+        fp_games = player_totals.get("fp_games", 0)
         avg_fantasy_points = (
-            float(sum(float(s.fantasy_points) for s in sn_with_fp) / len(sn_with_fp))
-            if sn_with_fp
+            player_totals["fp_sum"] / fp_games
+            if fp_games
             else None
         )
 
@@ -250,33 +306,33 @@ async def get_value_analysis(
         opponent = None
         is_home = None
 
-        analyses.append(PlayerValueAnalysis(
-            id=player.id,
-            name=player.name,
-            country=player.country,
-            fantasy_position=player.fantasy_position,
-            is_forward=is_forward,
-            price=price,
-            ownership_pct=ownership_pct,
-            opponent=opponent,
-            is_home=is_home,
-            is_starting=is_starting,
-            anytime_try_odds=anytime_try_odds,
-            implied_try_prob=round(implied_try_prob, 4) if implied_try_prob else None,
-            try_points=try_points,
-            expected_try_points=round(expected_try_points, 2) if expected_try_points else None,
-            try_ev_per_star=round(try_ev_per_star, 4) if try_ev_per_star else None,
-            avg_fantasy_points=round(avg_fantasy_points, 2) if avg_fantasy_points else None,
-            avg_tries_per_game=round(avg_tries, 3) if avg_tries is not None else None,
-            avg_tackles_per_game=round(avg_tackles, 2) if avg_tackles is not None else None,
-            avg_metres_per_game=round(avg_metres, 2) if avg_metres is not None else None,
-            avg_defenders_beaten_per_game=round(avg_db, 2) if avg_db is not None else None,
-            avg_turnovers_per_game=round(avg_to, 3) if avg_to is not None else None,
-            avg_offloads_per_game=round(avg_offloads, 3) if avg_offloads is not None else None,
-            total_games=total_games if total_games else None,
-            predicted_points=predicted_points,
-            overall_ev_per_star=round(overall_ev_per_star, 4) if overall_ev_per_star else None,
-        ))
+        analyses.append({
+            "id": player.id,
+            "name": player.name,
+            "country": player.country,
+            "fantasy_position": player.fantasy_position,
+            "is_forward": is_forward,
+            "price": price,
+            "ownership_pct": ownership_pct,
+            "opponent": opponent,
+            "is_home": is_home,
+            "is_starting": is_starting,
+            "anytime_try_odds": anytime_try_odds,
+            "implied_try_prob": round(implied_try_prob, 4) if implied_try_prob else None,
+            "try_points": try_points,
+            "expected_try_points": round(expected_try_points, 2) if expected_try_points else None,
+            "try_ev_per_star": round(try_ev_per_star, 4) if try_ev_per_star else None,
+            "avg_fantasy_points": round(avg_fantasy_points, 2) if avg_fantasy_points else None,
+            "avg_tries_per_game": round(avg_tries, 3) if avg_tries is not None else None,
+            "avg_tackles_per_game": round(avg_tackles, 2) if avg_tackles is not None else None,
+            "avg_metres_per_game": round(avg_metres, 2) if avg_metres is not None else None,
+            "avg_defenders_beaten_per_game": round(avg_db, 2) if avg_db is not None else None,
+            "avg_turnovers_per_game": round(avg_to, 3) if avg_to is not None else None,
+            "avg_offloads_per_game": round(avg_offloads, 3) if avg_offloads is not None else None,
+            "total_games": total_games if total_games else None,
+            "predicted_points": predicted_points,
+            "overall_ev_per_star": round(overall_ev_per_star, 4) if overall_ev_per_star else None,
+        })
 
     # Sort by requested field (descending — higher is better for EV metrics)
     valid_sort_fields = {
@@ -292,11 +348,11 @@ async def get_value_analysis(
 
     reverse = sort_by != "name"  # Descending for numeric, ascending for name
     analyses.sort(
-        key=lambda a: (getattr(a, sort_by) is not None, getattr(a, sort_by) or 0),
+        key=lambda a: (a[sort_by] is not None, a[sort_by] or 0),
         reverse=reverse,
     )
 
-    return analyses
+    return json_response(analyses)
 
 
 @router.get("/projections", response_model=List[PlayerProjection])
@@ -311,19 +367,19 @@ async def get_projections(
     """
     Player projections for roster players (those with a fantasy price
     for this round).  Uses historical Six Nations + club stats to
-    predict performance.
+    predict performance.  Rows are plain dicts, as in ``get_value_analysis``.
     """
     query = select(Player).options(
         selectinload(Player.prices),
         selectinload(Player.odds),
         selectinload(Player.six_nations_stats),
         selectinload(Player.club_stats),
-    )
+    ).where(Player.id.in_(_roster_ids(season, game_round)))
 
     if country:
-        query = query.where(Player.country == country.value)
+        query = query.where(Player.country == country)
     if position:
-        query = query.where(Player.fantasy_position == position.value)
+        query = query.where(Player.fantasy_position == position)
 
     result = await db.execute(query)
     players = result.scalars().all()
@@ -361,28 +417,28 @@ async def get_projections(
             else None
         )
 
-        projections.append(PlayerProjection(
-            id=player.id,
-            name=player.name,
-            country=player.country,
-            fantasy_position=player.fantasy_position,
-            price=price,
-            predicted_points=derived.predicted_points,
-            points_per_star=pps,
-            avg_tries=derived.avg_tries,
-            avg_tackles=derived.avg_tackles,
-            avg_metres=derived.avg_metres,
-            avg_turnovers=derived.avg_turnovers,
-            avg_defenders_beaten=derived.avg_defenders_beaten,
-            avg_offloads=derived.avg_offloads,
-            expected_minutes=derived.expected_minutes,
-            start_rate=derived.start_rate,
-            points_per_minute=derived.points_per_minute,
-            anytime_try_odds=anytime_try_odds,
-            opponent=None,
-            home_away=None,
-            total_games=derived.total_games,
-        ))
+        projections.append({
+            "id": player.id,
+            "name": player.name,
+            "country": player.country,
+            "fantasy_position": player.fantasy_position,
+            "price": price,
+            "predicted_points": derived.predicted_points,
+            "points_per_star": pps,
+            "avg_tries": derived.avg_tries,
+            "avg_tackles": derived.avg_tackles,
+            "avg_metres": derived.avg_metres,
+            "avg_turnovers": derived.avg_turnovers,
+            "avg_defenders_beaten": derived.avg_defenders_beaten,
+            "avg_offloads": derived.avg_offloads,
+            "expected_minutes": derived.expected_minutes,
+            "start_rate": derived.start_rate,
+            "points_per_minute": derived.points_per_minute,
+            "anytime_try_odds": anytime_try_odds,
+            "opponent": None,
+            "home_away": None,
+            "total_games": derived.total_games,
+        })
 
     # Sort
     valid_sort_fields = {
@@ -396,11 +452,11 @@ async def get_projections(
 
     reverse = sort_by != "name"
     projections.sort(
-        key=lambda p: (getattr(p, sort_by) is not None, getattr(p, sort_by) or 0),
+        key=lambda p: (p[sort_by] is not None, p[sort_by] or 0),
         reverse=reverse,
     )
 
-    return projections
+    return json_response(projections)
 
 
 @router.post("/backfill/club-fantasy-points")
@@ -514,8 +570,8 @@ async def get_player(
     return PlayerDetail(
         id=player.id,
         name=player.name,
-        country=Country(player.country),
-        fantasy_position=Position(player.fantasy_position),
+        country=player.country,
+        fantasy_position=player.fantasy_position,
         is_kicker=player.is_kicker,
         club=club_record.club if club_record else None,
         league=club_record.league if club_record else None,
@@ -540,8 +596,8 @@ async def create_player(
     """Create a new player"""
     db_player = Player(
         name=player.name,
-        country=player.country.value,
-        fantasy_position=player.fantasy_position.value,
+        country=player.country,
+        fantasy_position=player.fantasy_position,
         is_kicker=player.is_kicker,
     )
     db.add(db_player)
@@ -36,7 +36,7 @@ async def get_predictions(
     if position:
         predictions = [
             p for p in predictions
-            if p.player.fantasy_position == position.value
+            if p.player.fantasy_position == position
         ]
 
     if min_predicted is not None:
@@ -177,6 +177,12 @@ async def generate_predictions(
     result = await db.execute(query)
     players = result.scalars().all()
 
+    # Regenerating a round overwrites its predictions (one per player)
+    existing_result = await db.execute(
+        select(Prediction).where(Prediction.season == season, Prediction.round == round)
+    )
+    existing = {p.player_id: p for p in existing_result.scalars().all()}
+
     generated = 0
     for player in players:
         # Check if player is available
@@ -222,16 +228,14 @@ async def generate_predictions(
         pred_result = predictor.predict(features)
 
         # Save prediction
-        prediction = Prediction(
-            player_id=player.id,
-            season=season,
-            round=round,
-            predicted_points=pred_result["predicted_points"],
-            confidence_lower=pred_result["confidence_lower"],
-            confidence_upper=pred_result["confidence_upper"],
-            model_version="heuristic_v1",
-        )
-        db.add(prediction)
+        prediction = existing.get(player.id)
+        if prediction is None:
+            prediction = Prediction(player_id=player.id, season=season, round=round)
+            db.add(prediction)
+        prediction.predicted_points = pred_result["predicted_points"]
+        prediction.confidence_lower = pred_result["confidence_lower"]
+        prediction.confidence_upper = pred_result["confidence_upper"]
+        prediction.model_version = "heuristic_v1"
         generated += 1
 
     await db.commit()
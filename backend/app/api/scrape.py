@@ -8,8 +8,8 @@ Supports:
 """
 
 import asyncio
-import json
-import uuid
+import operator
+import time
 import logging
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -19,21 +19,33 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api import job_store
+from app.api.matches import invalidate_round_status_cache
+from app.api.streaming import dump_json, json_array_response
 from app.auth import require_admin
+from app.config import get_settings
 from app.fixtures import is_match_played
 from app.database import get_db, async_session
 from app.models.odds import MatchOdds, Odds
 from app.models.player import Player
 from app.models.scrape_run import ScrapeRun
 from app.models.user import User
+from app.scrapers import browser_pool
 from app.schemas.odds import AllMatchOddsScrapeRequest, OddsScrapeResponse
+from app.services.odds_service import OddsService
+from app.services.scrape_run_batcher import batcher as scrape_run_batcher
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# In-memory job store (sufficient for single-server use)
-_jobs: Dict[str, Dict[str, Any]] = {}
-_tasks: Dict[str, asyncio.Task] = {}
+# Scrape data is written before the run row is queued, so clear cached
+# /matches/status bodies at both points: on put and once the row is committed
+scrape_run_batcher.on_flush(invalidate_round_status_cache)
+
+# (season, round, slug, market_type) -> monotonic time of its last successful
+# save; reused for settings.scrape_cache_ttl seconds unless the request sets
+# force_refresh. Expired entries are pruned whenever a new save is recorded.
+_recent_scrapes: Dict[tuple, float] = {}
 
 # Market definitions: (url_suffix, market_type)
 ALL_MARKETS = [
@@ -54,15 +66,39 @@ MARKET_TYPE_MAP = {
     "try_scorer": "try_scorer",
 }
 
+# Market pages that can trail a discovered match URL
+_MARKET_URL_TAILS = frozenset({"winner", "anytime-tryscorer", "handicaps", "total-points"})
+
+# market_type -> OddsService save method. All take
+# (data, season, round_num, match_date, home_team, away_team).
+_SAVE_FN = {
+    "handicaps": OddsService.save_handicap_odds,
+    "match_totals": OddsService.save_match_totals_odds,
+    "try_scorer": OddsService.save_anytime_try_scorer_odds,
+}
+
+# Fields every overview-page match dict is guaranteed to carry
+_HC_GET = operator.itemgetter("home", "away", "slug", "home_line")
+
+
+def _base_match_url(url: str) -> str:
+    """Strip a trailing market page (e.g. ``/winner``) from a match URL."""
+    base_url = url.rstrip("/")
+    head, sep, tail = base_url.rpartition("/")
+    if sep and tail in _MARKET_URL_TAILS:
+        return head
+    return base_url
+
 
 async def _discover_matches(scraper):
-    """Discover Six Nations matches from Oddschecker."""
-    browser = await scraper._init_browser()
-    try:
-        page = await scraper._create_page(browser)
+    """Discover Six Nations matches from Oddschecker.
+
+    Each match dict gets a ``base_url`` that market suffixes are appended to.
+    """
+    async with scraper._page_session() as page:
         matches = await scraper.discover_six_nations_matches(page)
-    finally:
-        await scraper._close_browser()
+    for m in matches:
+        m["base_url"] = _base_match_url(m["url"])
     return matches
 
 
@@ -71,76 +107,78 @@ async def _record_scrape_run(
     status: str, started_at: datetime, result_summary: dict | None = None,
     warnings: list | None = None, error_message: str | None = None,
 ):
-    """Record a scrape run to the database."""
+    """Queue a scrape run row; the batcher inserts it with its neighbours."""
     completed_at = datetime.now(timezone.utc)
     duration = (completed_at - started_at).total_seconds()
-    async with async_session() as db:
-        run = ScrapeRun(
-            season=season, round=round_num, market_type=market_type,
-            match_slug=match_slug, status=status, started_at=started_at,
-            completed_at=completed_at, duration_seconds=duration,
-            result_summary=result_summary, warnings=warnings,
-            error_message=error_message,
-        )
-        db.add(run)
-        await db.commit()
+    await scrape_run_batcher.put(dict(
+        season=season, round=round_num, market_type=market_type,
+        match_slug=match_slug, status=status, started_at=started_at,
+        completed_at=completed_at, duration_seconds=duration,
+        result_summary=result_summary, warnings=warnings,
+        error_message=error_message,
+    ))
+    invalidate_round_status_cache()
 
 
 async def _scrape_market_for_match(
     scraper, match: Dict, url_suffix: str, market_type: str,
-    season: int, round_num: int,
+    season: int, round_num: int, match_date: date,
+    db: Optional[AsyncSession] = None,
+    db_lock: Optional[asyncio.Lock] = None,
+    force_refresh: bool = False,
 ):
-    """Scrape a single market for a single match and save to DB."""
-    from app.services.odds_service import OddsService
+    """Scrape a single market for a single match and save to DB.
+
+    When ``db`` is given the save runs on that (run-wide) session while
+    holding ``db_lock``, since concurrent scrapes share it. Otherwise a
+    session is opened just for this save.
 
+    Returns ``{"cached": True}`` without scraping if the same market was
+    saved within ``scrape_cache_ttl`` seconds and ``force_refresh`` is off.
+    """
     slug = match["slug"]
     home = match["home"]
     away = match["away"]
-    base_url = match["url"].rstrip("/")
-    for suffix in ("/winner", "/anytime-tryscorer", "/handicaps", "/total-points"):
-        if base_url.endswith(suffix):
-            base_url = base_url[: -len(suffix)]
-            break
-
-    url = f"{base_url}/{url_suffix}"
+    cache_key = (season, round_num, slug, market_type)
+    cache_ttl = get_settings().scrape_cache_ttl
+    if not force_refresh and (
+        time.monotonic() - _recent_scrapes.get(cache_key, float("-inf")) < cache_ttl
+    ):
+        logger.info(f"Skipping {market_type} for {slug}: scraped in the last {cache_ttl}s")
+        return {"cached": True}
+
+    url = f"{match['base_url']}/{url_suffix}"
     logger.info(f"Scraping {market_type} for {slug}: {url}")
 
     started_at = datetime.now(timezone.utc)
     try:
         raw_data = await scraper.scrape(url, market_type=market_type)
         parsed_data = scraper.parse(raw_data)
-        scraper.save_raw_json(raw_data, f"{slug}_{market_type}")
-
-        async with async_session() as db:
-            service = OddsService(db)
-            if market_type == "handicaps":
-                result = await service.save_handicap_odds(
-                    handicap_data=parsed_data,
-                    season=season,
-                    round_num=round_num,
-                    match_date=date.today(),
-                    home_team=home,
-                    away_team=away,
-                )
-            elif market_type == "match_totals":
-                result = await service.save_match_totals_odds(
-                    totals_data=parsed_data,
-                    season=season,
-                    round_num=round_num,
-                    match_date=date.today(),
-                    home_team=home,
-                    away_team=away,
-                )
-            else:  # try_scorer
-                result = await service.save_anytime_try_scorer_odds(
-                    odds_data=parsed_data,
-                    season=season,
-                    round_num=round_num,
-                    match_date=date.today(),
-                    home_team=home,
-                    away_team=away,
+        await asyncio.to_thread(scraper.save_raw_json, raw_data, f"{slug}_{market_type}")
+
+        save = _SAVE_FN[market_type]
+        if db is None:
+            async with async_session() as session:
+                result = await save(
+                    OddsService(session), parsed_data,
+                    season, round_num, match_date, home, away,
                 )
-
+        else:
+            async with db_lock:
+                try:
+                    result = await save(
+                        OddsService(db), parsed_data,
+                        season, round_num, match_date, home, away,
+                    )
+                except Exception:
+                    # Keep the shared session usable for the other markets
+                    await db.rollback()
+                    raise
+
+        now = time.monotonic()
+        for key in [k for k, saved in _recent_scrapes.items() if now - saved >= cache_ttl]:
+            del _recent_scrapes[key]
+        _recent_scrapes[cache_key] = now
         await _record_scrape_run(
             season, round_num, market_type, slug,
             "completed", started_at, result_summary=result,
@@ -166,10 +204,11 @@ async def _scrape_handicaps_via_overview(
     Returns a list of per-match result dicts.
     """
     from app.scrapers.oddschecker import OddscheckerScraper
-    from app.services.odds_service import OddsService
 
     job["message"] = "Scraping handicaps from overview page..."
-    scraper = OddscheckerScraper(headless=True)
+    scraper = OddscheckerScraper(
+        headless=True, browser=await browser_pool.acquire("oddschecker"),
+    )
 
     started_at = datetime.now(timezone.utc)
     overview_matches = await scraper.scrape_handicaps_overview()
@@ -179,66 +218,68 @@ async def _scrape_handicaps_via_overview(
         return []
 
     results = []
-    for m in overview_matches:
-        home = m["home"]
-        away = m["away"]
-        slug = m["slug"]
-
-        # Apply match filter if set
-        if match_filter is not None:
-            filter_home, filter_away = match_filter
-            if home.lower() != filter_home.lower() or away.lower() != filter_away.lower():
+    match_date = date.today()
+    # One session for every match's save instead of one per match
+    async with async_session() as db:
+        service = OddsService(db)
+        for m in overview_matches:
+            home, away, slug, home_line = _HC_GET(m)
+
+            # Apply match filter if set
+            if match_filter is not None:
+                filter_home, filter_away = match_filter
+                if home.lower() != filter_home.lower() or away.lower() != filter_away.lower():
+                    continue
+
+            # Skip already-played matches (unless single-match mode)
+            if match_filter is None and is_match_played(season, round_num, home, away):
                 continue
 
-        # Skip already-played matches (unless single-match mode)
-        if match_filter is None and is_match_played(season, round_num, home, away):
-            continue
-
-        # Build parsed_data in the format save_handicap_odds() expects
-        home_line = m["home_line"]
-        parsed_data = [{
-            "line": home_line,
-            "home_team": home,
-            "away_team": away,
-            "home_spread": home_line,
-            "home_odds": m.get("home_odds"),
-            "away_odds": m.get("away_odds"),
-            "num_bookmakers": 99,  # overview is already a consensus
-        }]
-
-        # Save raw JSON
-        raw_json = {
-            "market_type": "handicaps_overview",
-            "scraped_at": datetime.now(timezone.utc).isoformat(),
-            **m,
-        }
-        scraper.save_raw_json(raw_json, f"{slug}_handicaps")
-
-        # Save to DB
-        try:
-            async with async_session() as db:
-                service = OddsService(db)
+            # Build parsed_data in the format save_handicap_odds() expects
+            parsed_data = [{
+                "line": home_line,
+                "home_team": home,
+                "away_team": away,
+                "home_spread": home_line,
+                "home_odds": m.get("home_odds"),
+                "away_odds": m.get("away_odds"),
+                "num_bookmakers": 99,  # overview is already a consensus
+            }]
+
+            # Save raw JSON
+            raw_json = {
+                "market_type": "handicaps_overview",
+                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                **m,
+            }
+            await asyncio.to_thread(scraper.save_raw_json, raw_json, f"{slug}_handicaps")
+
+            # Save to DB
+            try:
                 db_result = await service.save_handicap_odds(
                     handicap_data=parsed_data,
                     season=season,
                     round_num=round_num,
-                    match_date=date.today(),
+                    match_date=match_date,
                     home_team=home,
                     away_team=away,
                 )
-            results.append({"match": slug, "status": "ok", "db_result": db_result})
-            await _record_scrape_run(
-                season, round_num, "handicaps", slug,
-                "completed", started_at, result_summary=db_result,
-            )
-            logger.info(f"Handicap saved for {slug}: line={home_line}")
-        except Exception as e:
-            results.append({"match": slug, "status": "error", "error": str(e)})
-            await _record_scrape_run(
-                season, round_num, "handicaps", slug,
-                "failed", started_at, error_message=str(e),
-            )
-            logger.error(f"Failed to save handicap for {slug}: {e}")
+                results.append({"match": slug, "status": "ok", "db_result": db_result})
+                await _record_scrape_run(
+                    season, round_num, "handicaps", slug,
+                    "completed", started_at, result_summary=db_result,
+                )
+                logger.info(f"Handicap saved for {slug}: line={home_line}")
+            except Exception as e:
+                # Roll back and start a fresh service (its player cache was expired)
+                await db.rollback()
+                service = OddsService(db)
+                results.append({"match": slug, "status": "error", "error": str(e)})
+                await _record_scrape_run(
+                    season, round_num, "handicaps", slug,
+                    "failed", started_at, error_message=str(e),
+                )
+                logger.error(f"Failed to save handicap for {slug}: {e}")
 
     return results
 
@@ -248,24 +289,27 @@ async def _run_scraper(
     season: int,
     round_num: int,
     markets: List[tuple],
-    per_match_missing: Optional[Dict[str, List[tuple]]] = None,
+    per_match_missing: Optional[Dict[tuple, List[tuple]]] = None,
     match_filter: Optional[tuple] = None,  # (home_team, away_team) to scrape one match only
+    force_refresh: bool = False,
 ):
     """Background task: discover matches and scrape specified markets.
 
     Args:
-        per_match_missing: Optional dict mapping "home|away" keys to their
+        per_match_missing: Optional dict mapping (home, away) keys to their
             missing market list. When provided, only the missing markets for
             each match are scraped. When None, all ``markets`` are scraped
             for every match (used by "Refresh All" / single-market buttons).
     """
     from app.scrapers.oddschecker import OddscheckerScraper
 
-    job = _jobs[job_id]
+    job = job_store.active_jobs[job_id]
 
     try:
         job["message"] = "Launching browser..."
-        scraper = OddscheckerScraper(headless=True)
+        scraper = OddscheckerScraper(
+            headless=True, browser=await browser_pool.acquire("oddschecker"),
+        )
 
         # Discover matches
         job["message"] = "Opening Oddschecker — finding matches..."
@@ -291,7 +335,7 @@ async def _run_scraper(
         if per_match_missing is not None:
             matches = [
                 m for m in matches
-                if f"{m['home']}|{m['away']}" in per_match_missing
+                if (m['home'], m['away']) in per_match_missing
             ]
 
         # Filter out already-played matches (only for bulk operations)
@@ -326,14 +370,13 @@ async def _run_scraper(
         logger.info(f"Found {len(matches)} matches: {[m['slug'] for m in matches]}")
 
         # ---- Handicaps: scrape via overview page (all matches at once) ----
-        has_handicaps = any(mt == "handicaps" for _, mt in markets)
+        requested_types = {mt for _, mt in markets}
         # Also check per_match_missing for handicaps
-        if not has_handicaps and per_match_missing is not None:
-            has_handicaps = any(
-                mt == "handicaps"
-                for missing_list in per_match_missing.values()
-                for _, mt in missing_list
+        if per_match_missing is not None:
+            requested_types.update(
+                mt for missing_list in per_match_missing.values() for _, mt in missing_list
             )
+        has_handicaps = "handicaps" in requested_types
 
         handicap_results = {}
         if has_handicaps:
@@ -352,10 +395,46 @@ async def _run_scraper(
         # ---- Other markets: scrape per-match as before ----
         non_handicap_markets = [(s, t) for s, t in markets if t != "handicaps"]
 
-        for i, match in enumerate(matches, 1):
+        sem = asyncio.Semaphore(get_settings().scrape_concurrency)
+        match_date = date.today()
+        # Saves share one session for the run; pages still load concurrently
+        db_lock = asyncio.Lock()
+
+        async def _scrape_one(match: Dict, url_suffix: str, market_type: str, match_result: Dict):
+            slug = match["slug"]
+            label = f"{match['home']} v {match['away']}"
+            market_label = market_type.replace("_", " ")
+            async with sem:
+                job["message"] = f"{label}: loading {market_label} page..."
+                job["current_match"] = slug
+
+                try:
+                    db_result = await _scrape_market_for_match(
+                        scraper, match, url_suffix, market_type,
+                        season, round_num, match_date,
+                        db=db, db_lock=db_lock, force_refresh=force_refresh,
+                    )
+                    if db_result.get("cached"):
+                        match_result["markets"][market_type] = {"status": "cached"}
+                        job["message"] = f"{label}: {market_label} scraped recently — not re-scraped"
+                        logger.info(f"  {market_type} for {slug}: recently scraped, skipped")
+                    else:
+                        match_result["markets"][market_type] = {
+                            "status": "ok",
+                            "db_result": db_result,
+                        }
+                        job["message"] = f"{label}: saved {market_label}"
+                        logger.info(f"  {market_type} for {slug}: saved successfully")
+                except Exception as e:
+                    logger.error(f"  {market_type} for {slug} failed: {e}", exc_info=True)
+                    match_result["markets"][market_type] = {
+                        "status": "error",
+                        "error": str(e),
+                    }
+                    job["message"] = f"{label}: {market_label} failed — {e}"
+
+        async def _scrape_match(match: Dict) -> Dict:
             slug = match["slug"]
-            home = match["home"]
-            away = match["away"]
             match_result = {"match": slug, "markets": {}}
 
             # Include handicap result if we scraped it
@@ -368,50 +447,25 @@ async def _run_scraper(
                 }
 
             # Use per-match markets if available, otherwise scrape all requested markets
-            match_key = f"{home}|{away}"
-            match_markets = (
-                per_match_missing[match_key]
-                if per_match_missing is not None and match_key in per_match_missing
-                else non_handicap_markets
-            )
-            # Filter out handicaps from per-match list (already handled above)
-            match_markets = [(s, t) for s, t in match_markets if t != "handicaps"]
-
-            for j, (url_suffix, market_type) in enumerate(match_markets, 1):
-                market_label = market_type.replace("_", " ")
-                job["message"] = (
-                    f"{home} v {away} ({i}/{len(matches)}): "
-                    f"loading {market_label} page ({j}/{len(match_markets)})..."
-                )
-                job["current_match"] = slug
+            match_key = (match['home'], match['away'])
+            if per_match_missing is not None and match_key in per_match_missing:
+                # Filter out handicaps from per-match list (already handled above)
+                match_markets = [
+                    (s, t) for s, t in per_match_missing[match_key] if t != "handicaps"
+                ]
+            else:
+                match_markets = non_handicap_markets
 
-                try:
-                    db_result = await _scrape_market_for_match(
-                        scraper, match, url_suffix, market_type,
-                        season, round_num,
-                    )
-                    match_result["markets"][market_type] = {
-                        "status": "ok",
-                        "db_result": db_result,
-                    }
-                    job["message"] = (
-                        f"{home} v {away} ({i}/{len(matches)}): "
-                        f"saved {market_label}"
-                    )
-                    logger.info(f"  {market_type} for {slug}: saved successfully")
-                except Exception as e:
-                    logger.error(f"  {market_type} for {slug} failed: {e}", exc_info=True)
-                    match_result["markets"][market_type] = {
-                        "status": "error",
-                        "error": str(e),
-                    }
-                    job["message"] = (
-                        f"{home} v {away} ({i}/{len(matches)}): "
-                        f"{market_label} failed — {e}"
-                    )
+            await asyncio.gather(*[
+                _scrape_one(match, url_suffix, market_type, match_result)
+                for url_suffix, market_type in match_markets
+            ])
+            job["matches_completed"] += 1
+            return match_result
 
-            job["matches_completed"] = i
-            job.setdefault("results", []).append(match_result)
+        # Pages load concurrently, bounded by the semaphore; results keep match order
+        async with async_session() as db:
+            job["results"] = list(await asyncio.gather(*[_scrape_match(m) for m in matches]))
 
         job["status"] = "completed"
         total_markets = sum(
@@ -419,7 +473,14 @@ async def _run_scraper(
             for m in r["markets"].values()
             if m.get("status") == "ok"
         )
+        cached_markets = sum(
+            1 for r in job["results"]
+            for m in r["markets"].values()
+            if m.get("status") == "cached"
+        )
         job["message"] = f"Done — scraped {total_markets} market(s) across {len(matches)} match(es)"
+        if cached_markets:
+            job["message"] += f"; {cached_markets} skipped as recently scraped"
         logger.info(f"Scrape complete: {len(matches)} matches, markets: {market_names}")
 
     except asyncio.CancelledError:
@@ -432,28 +493,19 @@ async def _run_scraper(
         job["message"] = f"Scrape failed: {e}"
 
 
-def _create_job(markets_label: str) -> str:
-    """Create a new job entry and return the job_id."""
-    job_id = str(uuid.uuid4())
-    _jobs[job_id] = {
-        "status": "in_progress",
-        "message": f"Starting {markets_label} scrape...",
-        "matches_found": 0,
-        "matches_completed": 0,
-        "current_match": None,
-        "results": [],
-    }
-    return job_id
-
-
 @router.post("/all-match-odds", response_model=OddsScrapeResponse)
 async def scrape_all_match_odds(
     request: AllMatchOddsScrapeRequest,
     _admin: User = Depends(require_admin),
 ):
     """Scrape all markets (handicaps, totals, try scorer) for all matches."""
-    job_id = _create_job("all markets")
-    _tasks[job_id] = asyncio.create_task(_run_scraper(job_id, request.season, request.round, ALL_MARKETS))
+    job_id = await job_store.claim_job(
+        "all markets", f"{request.season}:{request.round}:all markets",
+    )
+    job_store.start_job(job_id, _run_scraper(
+        job_id, request.season, request.round, ALL_MARKETS,
+        force_refresh=request.force_refresh,
+    ))
     return OddsScrapeResponse(
         status="in_progress",
         job_id=job_id,
@@ -484,8 +536,11 @@ async def scrape_single_market(
     market_type = MARKET_TYPE_MAP[market]
     markets = [(url_suffix, market_type)]
 
-    job_id = _create_job(market)
-    _tasks[job_id] = asyncio.create_task(_run_scraper(job_id, request.season, request.round, markets))
+    job_id = await job_store.claim_job(market, f"{request.season}:{request.round}:{market}")
+    job_store.start_job(job_id, _run_scraper(
+        job_id, request.season, request.round, markets,
+        force_refresh=request.force_refresh,
+    ))
     return OddsScrapeResponse(
         status="in_progress",
         job_id=job_id,
@@ -519,11 +574,15 @@ async def scrape_match_market(
     markets = [(url_suffix, market_type)]
     match_label = f"{request.home_team} v {request.away_team}"
 
-    job_id = _create_job(f"{market} for {match_label}")
-    _tasks[job_id] = asyncio.create_task(
-        _run_scraper(
+    job_id = await job_store.claim_job(
+        f"{market} for {match_label}",
+        f"{request.season}:{request.round}:{market} for {match_label}",
+    )
+    job_store.start_job(
+        job_id, _run_scraper(
             job_id, request.season, request.round, markets,
             match_filter=(request.home_team, request.away_team),
+            force_refresh=request.force_refresh,
         )
     )
     return OddsScrapeResponse(
@@ -543,15 +602,37 @@ async def scrape_missing_markets(
     season = request.season
     round_num = request.round
 
-    # Check what exists in DB
+    # One query returning a missing flag per market for every match: try scorer
+    # odds are counted per country in a CTE, joined to each match's two teams
+    ts = (
+        select(Player.country, func.count(Odds.id).label("n"))
+        .join(Odds, Odds.player_id == Player.id)
+        .where(
+            Odds.season == season,
+            Odds.round == round_num,
+            Odds.anytime_try_scorer.isnot(None),
+        )
+        .group_by(Player.country)
+        .cte("ts")
+    )
+    ts_home = ts.alias("ts_home")
+    ts_away = ts.alias("ts_away")
     result = await db.execute(
-        select(MatchOdds)
+        select(
+            MatchOdds.home_team,
+            MatchOdds.away_team,
+            MatchOdds.handicap_line.is_(None).label("handicaps"),
+            MatchOdds.over_under_line.is_(None).label("totals"),
+            (func.coalesce(ts_home.c.n, 0) + func.coalesce(ts_away.c.n, 0) == 0).label("try_scorer"),
+        )
+        .outerjoin(ts_home, ts_home.c.country == MatchOdds.home_team)
+        .outerjoin(ts_away, ts_away.c.country == MatchOdds.away_team)
         .where(MatchOdds.season == season, MatchOdds.round == round_num)
     )
-    matches = result.scalars().all()
+    matches = result.all()
 
-    # Build per-match missing map: "home|away" -> [(url_suffix, market_type), ...]
-    per_match_missing: Dict[str, List[tuple]] = {}
+    # Build per-match missing map: (home, away) -> [(url_suffix, market_type), ...]
+    per_match_missing: Dict[tuple, List[tuple]] = {}
     all_missing_types: set = set()
 
     if not matches:
@@ -560,8 +641,12 @@ async def scrape_missing_markets(
         # Can't build per-match map without DB data, fall back to flat scrape
         markets = [(MARKET_URL_MAP[m], MARKET_TYPE_MAP[m]) for m in all_missing_types]
         missing_label = ", ".join(sorted(all_missing_types))
-        job_id = _create_job(f"missing ({missing_label})")
-        _tasks[job_id] = asyncio.create_task(_run_scraper(job_id, season, round_num, markets))
+        job_id = await job_store.claim_job(
+            f"missing ({missing_label})", f"{season}:{round_num}:missing",
+        )
+        job_store.start_job(job_id, _run_scraper(
+            job_id, season, round_num, markets, force_refresh=request.force_refresh,
+        ))
         return OddsScrapeResponse(
             status="in_progress",
             job_id=job_id,
@@ -569,32 +654,13 @@ async def scrape_missing_markets(
         )
 
     for match in matches:
-        key = f"{match.home_team}|{match.away_team}"
+        key = (match.home_team, match.away_team)
         missing_markets = []
 
-        if match.handicap_line is None:
-            missing_markets.append((MARKET_URL_MAP["handicaps"], MARKET_TYPE_MAP["handicaps"]))
-            all_missing_types.add("handicaps")
-
-        if match.over_under_line is None:
-            missing_markets.append((MARKET_URL_MAP["totals"], MARKET_TYPE_MAP["totals"]))
-            all_missing_types.add("totals")
-
-        # Check try scorer odds for this specific match
-        try_result = await db.execute(
-            select(func.count())
-            .select_from(Odds)
-            .join(Player, Odds.player_id == Player.id)
-            .where(
-                Odds.season == season,
-                Odds.round == round_num,
-                Player.country.in_([match.home_team, match.away_team]),
-                Odds.anytime_try_scorer.isnot(None),
-            )
-        )
-        if (try_result.scalar() or 0) == 0:
-            missing_markets.append((MARKET_URL_MAP["try_scorer"], MARKET_TYPE_MAP["try_scorer"]))
-            all_missing_types.add("try_scorer")
+        for market in ("handicaps", "totals", "try_scorer"):
+            if getattr(match, market):
+                missing_markets.append((MARKET_URL_MAP[market], MARKET_TYPE_MAP[market]))
+                all_missing_types.add(market)
 
         if missing_markets:
             per_match_missing[key] = missing_markets
@@ -610,9 +676,15 @@ async def scrape_missing_markets(
     all_markets = [(MARKET_URL_MAP[m], MARKET_TYPE_MAP[m]) for m in all_missing_types]
     match_count = len(per_match_missing)
     missing_label = ", ".join(sorted(all_missing_types))
-    job_id = _create_job(f"missing ({missing_label}) for {match_count} match(es)")
-    _tasks[job_id] = asyncio.create_task(
-        _run_scraper(job_id, season, round_num, all_markets, per_match_missing=per_match_missing)
+    job_id = await job_store.claim_job(
+        f"missing ({missing_label}) for {match_count} match(es)",
+        f"{season}:{round_num}:missing",
+    )
+    job_store.start_job(
+        job_id, _run_scraper(
+            job_id, season, round_num, all_markets,
+            per_match_missing=per_match_missing, force_refresh=request.force_refresh,
+        )
     )
     return OddsScrapeResponse(
         status="in_progress",
@@ -621,19 +693,75 @@ async def scrape_missing_markets(
     )
 
 
+def _write_players_json(
+    output_path: Path, season: int, round_num: int, scraped_at: str, players: List[Dict],
+) -> None:
+    """Write a fantasy_players_*.json file one player record at a time.
+
+    Streams the header and each record straight into a 1 MiB buffered file
+    instead of serialising the whole document in memory first.
+    """
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(
+            b'{\n  "season": %d,\n  "round": %d,\n  "scraped_at": %s,\n'
+            b'  "player_count": %d,\n  "players": [\n'
+            % (season, round_num, dump_json(scraped_at), len(players))
+        )
+        for i, player in enumerate(players):
+            if i:
+                f.write(b",\n")
+            f.write(b"    " + dump_json(player))
+        f.write(b"\n  ]\n}\n")
+
+
+async def _import_with_archive(
+    season: int, round_num: int, started_at: datetime, players: List[Dict],
+) -> Dict[str, Any]:
+    """Import scraped fantasy players, writing the JSON archive copy alongside.
+
+    The import works from the in-memory list, so the file is written in a
+    thread while it runs. It is only a record-keeping copy: a failed write is
+    logged once the import has finished and never fails the job.
+    """
+    from app.services.import_service import import_players
+
+    data_dir = Path(__file__).resolve().parent.parent.parent / "data"
+    output_path = data_dir / f"fantasy_players_{started_at.strftime('%Y%m%d_%H%M%S')}.json"
+
+    def write_archive():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        _write_players_json(
+            output_path, season, round_num, started_at.isoformat(), players,
+        )
+
+    archive_task = asyncio.create_task(asyncio.to_thread(write_archive))
+    try:
+        async with async_session() as db:
+            result = await import_players(db, season, round_num, players)
+    finally:
+        try:
+            await archive_task
+        except Exception as e:
+            logger.warning(f"Failed to write {output_path.name}: {e}")
+    return result
+
+
 async def _run_fantasy_import(
     job_id: str, season: int, round_num: int, headless: bool,
 ):
     """Background task: scrape fantasy prices and import to DB."""
     from app.scrapers.fantasy_sixnations import FantasySixNationsScraper, SessionExpiredError
-    from app.services.import_service import import_scraped_json
 
-    job = _jobs[job_id]
+    job = job_store.active_jobs[job_id]
     started_at = datetime.now(timezone.utc)
 
     try:
         job["message"] = "Launching browser..."
-        scraper = FantasySixNationsScraper(headless=headless)
+        # The login flow needs a visible window, so only headless runs share the pool
+        scraper = FantasySixNationsScraper(
+            headless=headless,
+            browser=await browser_pool.acquire("fantasy") if headless else None,
+        )
 
         job["message"] = "Opening Fantasy Six Nations..."
         raw_data = await scraper.scrape()
@@ -650,23 +778,8 @@ async def _run_fantasy_import(
             )
             return
 
-        # Save to JSON for record-keeping
-        data_dir = Path(__file__).resolve().parent.parent.parent / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        output_path = data_dir / f"fantasy_players_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        output = {
-            "season": season,
-            "round": round_num,
-            "scraped_at": datetime.utcnow().isoformat(),
-            "player_count": len(players),
-            "players": players,
-        }
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False, default=str)
-
         job["message"] = f"Importing {len(players)} players..."
-        async with async_session() as db:
-            result = await import_scraped_json(db, str(output_path))
+        result = await _import_with_archive(season, round_num, started_at, players)
 
         job["status"] = "completed"
         parts = [
@@ -709,9 +822,11 @@ async def import_prices(
     _admin: User = Depends(require_admin),
 ):
     """Scrape fantasy prices headlessly (using saved session) and import to DB."""
-    job_id = _create_job("fantasy prices (headless)")
-    _tasks[job_id] = asyncio.create_task(
-        _run_fantasy_import(job_id, request.season, request.round, headless=True)
+    job_id = await job_store.claim_job(
+        "fantasy prices (headless)", f"{request.season}:{request.round}:fantasy prices",
+    )
+    job_store.start_job(
+        job_id, _run_fantasy_import(job_id, request.season, request.round, headless=True)
     )
     return OddsScrapeResponse(
         status="in_progress",
@@ -726,9 +841,11 @@ async def import_prices_with_login(
     _admin: User = Depends(require_admin),
 ):
     """Scrape fantasy prices with visible browser for login, then import to DB."""
-    job_id = _create_job("fantasy prices (login)")
-    _tasks[job_id] = asyncio.create_task(
-        _run_fantasy_import(job_id, request.season, request.round, headless=False)
+    job_id = await job_store.claim_job(
+        "fantasy prices (login)", f"{request.season}:{request.round}:fantasy prices",
+    )
+    job_store.start_job(
+        job_id, _run_fantasy_import(job_id, request.season, request.round, headless=False)
     )
     return OddsScrapeResponse(
         status="in_progress",
@@ -737,19 +854,23 @@ async def import_prices_with_login(
     )
 
 
-async def _run_scrape_all(job_id: str, season: int, round_num: int):
+async def _run_scrape_all(
+    job_id: str, season: int, round_num: int, force_refresh: bool = False,
+):
     """Background task: scrape all odds markets + fantasy prices in sequence."""
     from app.scrapers.oddschecker import OddscheckerScraper
     from app.scrapers.fantasy_sixnations import FantasySixNationsScraper, SessionExpiredError
-    from app.services.import_service import import_scraped_json
 
-    job = _jobs[job_id]
+    job = job_store.active_jobs[job_id]
 
     try:
         # Discover matches
         job["message"] = "Discovering matches..."
         job["step_label"] = "Discovering matches"
-        scraper = OddscheckerScraper(headless=True)
+        # Odds steps share one browser; each scrape gets its own context
+        scraper = OddscheckerScraper(
+            headless=True, browser=await browser_pool.acquire("oddschecker"),
+        )
         matches = await _discover_matches(scraper)
 
         if not matches:
@@ -776,6 +897,7 @@ async def _run_scrape_all(job_id: str, season: int, round_num: int):
 
         errors = []
         total_ok = 0
+        total_cached = 0  # markets skipped as recently scraped
 
         # Step 1: Handicaps via overview page (all matches at once)
         job["current_step"] = 1
@@ -803,23 +925,43 @@ async def _run_scrape_all(job_id: str, season: int, round_num: int):
             ("anytime-tryscorer", "try_scorer", "Try scorers"),
         ]
 
-        for step_idx, (url_suffix, market_type, market_label) in enumerate(per_match_markets, 2):
-            job["current_step"] = step_idx
-            for mi, match in enumerate(matches, 1):
-                slug = match["slug"]
-                job["step_label"] = f"Step {step_idx}/4: {market_label} — {slug} ({mi}/{len(matches)})"
-                job["message"] = job["step_label"]
+        sem = asyncio.Semaphore(get_settings().scrape_concurrency)
+        match_date = date.today()
+        # Saves share one session for steps 2-3; pages still load concurrently
+        db_lock = asyncio.Lock()
 
-                try:
-                    await _scrape_market_for_match(
-                        scraper, match, url_suffix, market_type,
-                        season, round_num,
+        async with async_session() as db:
+            for step_idx, (url_suffix, market_type, market_label) in enumerate(per_match_markets, 2):
+                job["current_step"] = step_idx
+                job["step_label"] = f"Step {step_idx}/4: {market_label} (0/{len(matches)})"
+                job["message"] = job["step_label"]
+                done = 0
+
+                async def _scrape_one(match: Dict):
+                    nonlocal done, total_ok, total_cached
+                    slug = match["slug"]
+                    async with sem:
+                        try:
+                            db_result = await _scrape_market_for_match(
+                                scraper, match, url_suffix, market_type,
+                                season, round_num, match_date,
+                                db=db, db_lock=db_lock, force_refresh=force_refresh,
+                            )
+                            if db_result.get("cached"):
+                                total_cached += 1
+                            else:
+                                total_ok += 1
+                        except Exception as e:
+                            err_msg = f"{market_label} for {slug}: {e}"
+                            logger.error(f"Scrape-all: {err_msg}", exc_info=True)
+                            errors.append(err_msg)
+                    done += 1
+                    job["step_label"] = (
+                        f"Step {step_idx}/4: {market_label} — {slug} ({done}/{len(matches)})"
                     )
-                    total_ok += 1
-                except Exception as e:
-                    err_msg = f"{market_label} for {slug}: {e}"
-                    logger.error(f"Scrape-all: {err_msg}", exc_info=True)
-                    errors.append(err_msg)
+                    job["message"] = job["step_label"]
+
+                await asyncio.gather(*[_scrape_one(m) for m in matches])
 
         # Step 4: Fantasy prices import
         job["current_step"] = 4
@@ -828,7 +970,10 @@ async def _run_scrape_all(job_id: str, season: int, round_num: int):
 
         started_at = datetime.now(timezone.utc)
         try:
-            fantasy_scraper = FantasySixNationsScraper(headless=True)
+            # Same pooled browser (and launch flags) as _run_fantasy_import
+            fantasy_scraper = FantasySixNationsScraper(
+                headless=True, browser=await browser_pool.acquire("fantasy"),
+            )
 
             job["message"] = "Step 4/4: Fantasy prices — scraping..."
             raw_data = await fantasy_scraper.scrape()
@@ -843,23 +988,8 @@ async def _run_scrape_all(job_id: str, season: int, round_num: int):
                     "failed", started_at, error_message="No players found",
                 )
             else:
-                # Save to JSON for record-keeping
-                data_dir = Path(__file__).resolve().parent.parent.parent / "data"
-                data_dir.mkdir(parents=True, exist_ok=True)
-                output_path = data_dir / f"fantasy_players_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                output = {
-                    "season": season,
-                    "round": round_num,
-                    "scraped_at": datetime.utcnow().isoformat(),
-                    "player_count": len(players),
-                    "players": players,
-                }
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(output, f, indent=2, ensure_ascii=False, default=str)
-
                 job["message"] = f"Step 4/4: Fantasy prices — importing {len(players)} players..."
-                async with async_session() as db:
-                    result = await import_scraped_json(db, str(output_path))
+                result = await _import_with_archive(season, round_num, started_at, players)
 
                 total_ok += 1
                 await _record_scrape_run(
@@ -884,12 +1014,14 @@ async def _run_scrape_all(job_id: str, season: int, round_num: int):
             )
 
         # Final status
-        if total_ok == 0:
+        if total_ok == 0 and total_cached == 0:
             job["status"] = "failed"
             job["message"] = f"All steps failed: {'; '.join(errors)}"
         else:
             job["status"] = "completed"
             parts = [f"Done — {total_ok} successful"]
+            if total_cached:
+                parts.append(f"; {total_cached} skipped as recently scraped")
             if errors:
                 parts.append(f", {len(errors)} error(s): {'; '.join(errors)}")
             job["message"] = "".join(parts)
@@ -909,12 +1041,16 @@ async def scrape_all(
     _admin: User = Depends(require_admin),
 ):
     """Scrape everything: all odds markets + fantasy prices."""
-    job_id = _create_job("all markets + prices")
-    _jobs[job_id]["total_steps"] = 4
-    _jobs[job_id]["current_step"] = 0
-    _jobs[job_id]["step_label"] = "Starting..."
-    _tasks[job_id] = asyncio.create_task(
-        _run_scrape_all(job_id, request.season, request.round)
+    job_id = await job_store.claim_job(
+        "all markets + prices", f"{request.season}:{request.round}:all markets + prices",
+    )
+    job_store.active_jobs[job_id]["total_steps"] = 4
+    job_store.active_jobs[job_id]["current_step"] = 0
+    job_store.active_jobs[job_id]["step_label"] = "Starting..."
+    job_store.start_job(
+        job_id, _run_scrape_all(
+            job_id, request.season, request.round, force_refresh=request.force_refresh,
+        )
     )
     return OddsScrapeResponse(
         status="in_progress",
@@ -934,24 +1070,19 @@ async def _run_fantasy_stats(job_id: str, season: int, round_num: int):
 
     from scrape_fantasy_stats import (
         create_browser_context, dismiss_overlays, wait_for_table,
-        select_round, scrape_all_pages, parse_players, save_to_db,
+        select_round, scrape_pages, parse_players, save_to_db,
         STATS_URL,
     )
-    from playwright.async_api import async_playwright
 
-    job = _jobs[job_id]
+    job = job_store.active_jobs[job_id]
     started_at = datetime.now(timezone.utc)
 
     try:
         job["message"] = "Launching browser..."
-        pw = await async_playwright().start()
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=["--disable-blink-features=AutomationControlled", "--no-sandbox"],
-        )
+        browser = await browser_pool.acquire("fantasy")
+        context = await create_browser_context(browser)
 
         try:
-            context = await create_browser_context(browser)
             page = await context.new_page()
 
             job["message"] = "Navigating to stats page..."
@@ -985,11 +1116,14 @@ async def _run_fantasy_stats(job_id: str, season: int, round_num: int):
 
             await asyncio.sleep(2)
 
+            # Parse each page as it arrives rather than after the last one
             job["message"] = f"Scraping stats for round {round_num}..."
-            raw_players = await scrape_all_pages(page)
-
-            job["message"] = "Parsing player stats..."
-            records = parse_players(raw_players, round_num)
+            records = []
+            async for raw_players in scrape_pages(page):
+                records.extend(parse_players(raw_players, round_num))
+                job["message"] = (
+                    f"Scraping stats for round {round_num} — {len(records)} players so far..."
+                )
 
             if not records:
                 job["status"] = "failed"
@@ -1013,8 +1147,7 @@ async def _run_fantasy_stats(job_id: str, season: int, round_num: int):
             )
 
         finally:
-            await browser.close()
-            await pw.stop()
+            await context.close()
 
     except asyncio.CancelledError:
         job["status"] = "cancelled"
@@ -1035,9 +1168,11 @@ async def scrape_fantasy_stats_endpoint(
     _admin: User = Depends(require_admin),
 ):
     """Trigger fantasy stats scraper for the specified round."""
-    job_id = _create_job("fantasy stats")
-    _tasks[job_id] = asyncio.create_task(
-        _run_fantasy_stats(job_id, request.season, request.round)
+    job_id = await job_store.claim_job(
+        "fantasy stats", f"{request.season}:{request.round}:fantasy stats",
+    )
+    job_store.start_job(
+        job_id, _run_fantasy_stats(job_id, request.season, request.round)
     )
     return OddsScrapeResponse(
         status="in_progress",
@@ -1049,16 +1184,12 @@ async def scrape_fantasy_stats_endpoint(
 @router.get("/active")
 async def get_active_jobs():
     """Return any in-progress jobs and the most recent completed/failed job."""
-    active = []
-    latest_finished = None
-    for jid, job in _jobs.items():
-        entry = {"job_id": jid, **job}
-        if job["status"] == "in_progress":
-            active.append(entry)
-        elif latest_finished is None or jid > (latest_finished.get("job_id") or ""):
-            latest_finished = entry
-
-    return {"active": active, "latest_finished": latest_finished}
+    active = [
+        {"job_id": jid, **job}
+        for jid, job in job_store.active_jobs.items()
+        if job["status"] == "in_progress"
+    ]
+    return {"active": active, "latest_finished": job_store.latest_finished()}
 
 
 @router.post("/kill/{job_id}")
@@ -1067,7 +1198,7 @@ async def kill_scrape_job(
     _admin: User = Depends(require_admin),
 ):
     """Cancel a running scrape job."""
-    task = _tasks.get(job_id)
+    task = job_store.tasks.get(job_id)
     if not task:
         return {"status": "not_found", "message": "Job not found"}
     if task.done():
@@ -1079,10 +1210,30 @@ async def kill_scrape_job(
 @router.get("/status/{job_id}")
 async def get_scrape_status(job_id: str):
     """Get the status of a scrape job."""
-    job = _jobs.get(job_id)
+    job = job_store.get_job(job_id) or await job_store.load_job(job_id)
     if not job:
         return {"status": "not_found", "message": "Job not found"}
-    return job
+    # Snapshot so serialisation doesn't race the background task's updates
+    return dict(job)
+
+
+def _history_row(r: ScrapeRun) -> Dict[str, Any]:
+    return {
+        "id": r.id,
+        "market_type": r.market_type,
+        "match_slug": r.match_slug,
+        "status": r.status,
+        "started_at": r.started_at.isoformat() if r.started_at else None,
+        "completed_at": r.completed_at.isoformat() if r.completed_at else None,
+        # Derived like ScrapeRunSummary.duration_seconds rather than read from the column
+        "duration_seconds": (
+            (r.completed_at - r.started_at).total_seconds()
+            if r.completed_at and r.started_at else None
+        ),
+        "result_summary": r.result_summary,
+        "warnings": r.warnings or [],
+        "error_message": r.error_message,
+    }
 
 
 @router.get("/history")
@@ -1090,29 +1241,13 @@ async def get_scrape_history(
     season: int = 2026,
     game_round: int = 1,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db),
     _admin: User = Depends(require_admin),
 ):
-    """Get scrape run history for a round."""
-    result = await db.execute(
+    """Get scrape run history for a round (streamed as a JSON array)."""
+    stmt = (
         select(ScrapeRun)
         .where(ScrapeRun.season == season, ScrapeRun.round == game_round)
         .order_by(ScrapeRun.started_at.desc())
         .limit(limit)
     )
-    runs = result.scalars().all()
-    return [
-        {
-            "id": r.id,
-            "market_type": r.market_type,
-            "match_slug": r.match_slug,
-            "status": r.status,
-            "started_at": r.started_at.isoformat() if r.started_at else None,
-            "completed_at": r.completed_at.isoformat() if r.completed_at else None,
-            "duration_seconds": r.duration_seconds,
-            "result_summary": r.result_summary,
-            "warnings": r.warnings,
-            "error_message": r.error_message,
-        }
-        for r in runs
-    ]
+    return json_array_response(stmt, _history_row)
@@ -1,13 +1,14 @@
 """
 API endpoints for player statistics from Excel data and historical stats from database.
 """
+from datetime import date
 from typing import Optional, List
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Float, cast, func, select, tuple_
 
+from app.api.streaming import decode_cursor, json_page_response, json_response
 from app.database import get_db
 from app.models import Player
 from app.models.stats import SixNationsStats, ClubStats
@@ -26,17 +27,17 @@ async def get_all_stats(
     Get all player stats from the Excel file.
     Optionally filter by country or position.
     """
-    service = ExcelStatsService()
-    players = service.get_all_players()
+    stats = ExcelStatsService().load()
 
-    # Apply filters if provided
+    # Filters are index lookups; with both, scan the (smaller) country list
     if country:
-        players = [p for p in players if p.get("country") == country]
-
+        players = stats.by_country.get(country, [])
+        if position:
+            players = [p for p in players if p.get("position") == position]
+        return json_response(players)
     if position:
-        players = [p for p in players if p.get("position") == position]
-
-    return players
+        return json_response(stats.by_position.get(position, []))
+    return json_response(stats.players)
 
 
 @router.get("/countries")
@@ -48,10 +49,58 @@ async def get_countries():
 @router.get("/positions")
 async def get_positions():
     """Get list of unique positions from the data."""
-    service = ExcelStatsService()
-    players = service.get_all_players()
-    positions = sorted(set(p.get("position") for p in players if p.get("position")))
-    return positions
+    return ExcelStatsService().get_positions()
+
+
+# Player columns shared by both historical endpoints (after the stat row id)
+_PLAYER_COLUMNS = (
+    Player.id.label("player_id"),
+    Player.name.label("player_name"),
+    Player.country,
+    Player.fantasy_position,
+)
+
+_SIX_NATIONS_COLUMNS = (SixNationsStats.id,) + _PLAYER_COLUMNS + tuple(
+    getattr(SixNationsStats, name) for name in (
+        "season", "round", "match_date", "opponent", "home_away", "actual_position",
+        "started", "minutes_played", "tries", "try_assists", "conversions",
+        "penalties_kicked", "drop_goals", "defenders_beaten", "metres_carried",
+        "clean_breaks", "offloads", "fifty_22_kicks", "tackles_made", "tackles_missed",
+        "turnovers_won", "lineout_steals", "scrums_won", "penalties_conceded",
+        "yellow_cards", "red_cards", "player_of_match",
+    )
+) + (
+    # Numeric -> float in SQL; zero is reported as null, as it always has been
+    cast(func.nullif(SixNationsStats.fantasy_points, 0), Float).label("fantasy_points"),
+)
+
+_CLUB_COLUMNS = (ClubStats.id,) + _PLAYER_COLUMNS + tuple(
+    getattr(ClubStats, name) for name in (
+        "league", "season", "match_date", "opponent", "home_away", "started",
+        "minutes_played", "tries", "try_assists", "conversions", "penalties_kicked",
+        "drop_goals", "defenders_beaten", "metres_carried", "clean_breaks", "offloads",
+        "tackles_made", "tackles_missed", "turnovers_won", "lineout_steals",
+        "scrums_won", "penalties_conceded", "yellow_cards", "red_cards",
+    )
+)
+
+
+def _row_dict(row) -> dict:
+    return dict(row._mapping)
+
+
+def _keyset(row: dict) -> dict:
+    return {"match_date": row["match_date"], "id": row["id"]}
+
+
+def _after_cursor(query, model, cursor: str):
+    """Restrict an (match_date DESC, id DESC) query to rows after ``cursor``."""
+    values = decode_cursor(cursor)
+    try:
+        after = (date.fromisoformat(values["match_date"]), int(values["id"]))
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return query.where(tuple_(model.match_date, model.id) < after)
 
 
 @router.get("/historical/six-nations")
@@ -59,68 +108,31 @@ async def get_historical_six_nations_stats(
     country: Optional[str] = Query(None, description="Filter by country"),
     position: Optional[str] = Query(None, description="Filter by position"),
     season: Optional[int] = Query(None, description="Filter by season"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(500, ge=1, le=2000, description="Rows per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     Get all Six Nations historical stats from database.
-    Returns per-match stats for each player.
+    Returns per-match stats for each player, newest first, one page at a time:
+    ``{"data": [...], "next_cursor": ...}`` (null on the last page).
     """
-    query = select(SixNationsStats).options(
-        selectinload(SixNationsStats.player)
-    ).order_by(SixNationsStats.match_date.desc())
+    query = (
+        select(*_SIX_NATIONS_COLUMNS)
+        .join(Player, SixNationsStats.player_id == Player.id)
+        .order_by(SixNationsStats.match_date.desc(), SixNationsStats.id.desc())
+    )
 
     if season:
-        query = query.join(SixNationsStats.player).where(SixNationsStats.season == season)
+        query = query.where(SixNationsStats.season == season)
+    if country:
+        query = query.where(Player.country == country)
+    if position:
+        query = query.where(Player.fantasy_position == position)
 
-    result = await db.execute(query)
-    stats = result.scalars().all()
-
-    response = []
-    for stat in stats:
-        player = stat.player
-
-        # Apply filters
-        if country and player.country != country:
-            continue
-        if position and player.fantasy_position != position:
-            continue
-
-        response.append({
-            "player_id": player.id,
-            "player_name": player.name,
-            "country": player.country,
-            "fantasy_position": player.fantasy_position,
-            "season": stat.season,
-            "round": stat.round,
-            "match_date": stat.match_date.isoformat() if stat.match_date else None,
-            "opponent": stat.opponent,
-            "home_away": stat.home_away,
-            "actual_position": stat.actual_position,
-            "started": stat.started,
-            "minutes_played": stat.minutes_played,
-            "tries": stat.tries,
-            "try_assists": stat.try_assists,
-            "conversions": stat.conversions,
-            "penalties_kicked": stat.penalties_kicked,
-            "drop_goals": stat.drop_goals,
-            "defenders_beaten": stat.defenders_beaten,
-            "metres_carried": stat.metres_carried,
-            "clean_breaks": stat.clean_breaks,
-            "offloads": stat.offloads,
-            "fifty_22_kicks": stat.fifty_22_kicks,
-            "tackles_made": stat.tackles_made,
-            "tackles_missed": stat.tackles_missed,
-            "turnovers_won": stat.turnovers_won,
-            "lineout_steals": stat.lineout_steals,
-            "scrums_won": stat.scrums_won,
-            "penalties_conceded": stat.penalties_conceded,
-            "yellow_cards": stat.yellow_cards,
-            "red_cards": stat.red_cards,
-            "player_of_match": stat.player_of_match,
-            "fantasy_points": float(stat.fantasy_points) if stat.fantasy_points else None,
-        })
-
-    return response
+    if cursor:
+        query = _after_cursor(query, SixNationsStats, cursor)
+
+    return json_page_response(query, _row_dict, limit, _keyset)
 
 
 @router.get("/historical/club")
@@ -128,64 +140,31 @@ async def get_historical_club_stats(
     country: Optional[str] = Query(None, description="Filter by country"),
     position: Optional[str] = Query(None, description="Filter by position"),
     league: Optional[str] = Query(None, description="Filter by league"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(500, ge=1, le=2000, description="Rows per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     Get all club competition historical stats from database.
-    Returns per-match stats for each player.
+    Returns per-match stats for each player, newest first, one page at a time:
+    ``{"data": [...], "next_cursor": ...}`` (null on the last page).
     """
-    query = select(ClubStats).options(
-        selectinload(ClubStats.player)
-    ).order_by(ClubStats.match_date.desc())
+    query = (
+        select(*_CLUB_COLUMNS)
+        .join(Player, ClubStats.player_id == Player.id)
+        .order_by(ClubStats.match_date.desc(), ClubStats.id.desc())
+    )
 
     if league:
         query = query.where(ClubStats.league == league)
+    if country:
+        query = query.where(Player.country == country)
+    if position:
+        query = query.where(Player.fantasy_position == position)
 
-    result = await db.execute(query)
-    stats = result.scalars().all()
-
-    response = []
-    for stat in stats:
-        player = stat.player
-
-        # Apply filters
-        if country and player.country != country:
-            continue
-        if position and player.fantasy_position != position:
-            continue
-
-        response.append({
-            "player_id": player.id,
-            "player_name": player.name,
-            "country": player.country,
-            "fantasy_position": player.fantasy_position,
-            "league": stat.league,
-            "season": stat.season,
-            "match_date": stat.match_date.isoformat() if stat.match_date else None,
-            "opponent": stat.opponent,
-            "home_away": stat.home_away,
-            "started": stat.started,
-            "minutes_played": stat.minutes_played,
-            "tries": stat.tries,
-            "try_assists": stat.try_assists,
-            "conversions": stat.conversions,
-            "penalties_kicked": stat.penalties_kicked,
-            "drop_goals": stat.drop_goals,
-            "defenders_beaten": stat.defenders_beaten,
-            "metres_carried": stat.metres_carried,
-            "clean_breaks": stat.clean_breaks,
-            "offloads": stat.offloads,
-            "tackles_made": stat.tackles_made,
-            "tackles_missed": stat.tackles_missed,
-            "turnovers_won": stat.turnovers_won,
-            "lineout_steals": stat.lineout_steals,
-            "scrums_won": stat.scrums_won,
-            "penalties_conceded": stat.penalties_conceded,
-            "yellow_cards": stat.yellow_cards,
-            "red_cards": stat.red_cards,
-        })
-
-    return response
+    if cursor:
+        query = _after_cursor(query, ClubStats, cursor)
+
+    return json_page_response(query, _row_dict, limit, _keyset)
 
 
 @router.get("/historical/positions")
@@ -227,7 +206,9 @@ async def get_fantasy_stats(
 ):
     """Get per-round scraped fantasy stats from the 2026 season."""
     service = FantasyStatsService(db)
-    return await service.get_players(game_round=game_round, country=country, position=position)
+    return json_response(
+        await service.get_players(game_round=game_round, country=country, position=position)
+    )
 
 
 @router.get("/fantasy/metadata")
@@ -267,4 +248,6 @@ async def get_fantasy_season_summary(
 ):
     """Get aggregated season stats: per-player averages and position breakdowns."""
     service = FantasyStatsService(db)
-    return await service.get_season_summary(country=country, position=position, next_round=next_round)
+    return json_response(
+        await service.get_season_summary(country=country, position=position, next_round=next_round)
+    )
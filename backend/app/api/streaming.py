@@ -0,0 +1,119 @@
+"""
+Helpers for endpoints that stream large JSON arrays.
+
+Rows are encoded and sent one at a time as the database cursor yields them,
+so the response never holds the whole result set (or a list of dicts built
+from it) in memory. ``json_page_response`` does the same for one keyset page,
+wrapped as ``{"data": [...], "next_cursor": ...}``.
+
+``json_response`` is the non-streaming counterpart for endpoints that return
+plain dicts/lists with no response_model: without it FastAPI walks the whole
+payload through ``jsonable_encoder`` before ``json.dumps``.
+"""
+
+from typing import Any, AsyncIterator, Callable, Optional
+import base64
+import binascii
+import json
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.sql import Select
+
+from app.database import async_session
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialise one JSON value to UTF-8 bytes."""
+    return orjson.dumps(obj, default=str)
+
+
+def json_response(content: Any) -> Response:
+    """Encode already-JSON-friendly dicts/lists in one pass."""
+    return Response(content=dump_json(content), media_type="application/json")
+
+
+async def _stream_rows(
+    stmt: Select, to_dict: Callable[[Any], dict], scalars: bool,
+) -> AsyncIterator[bytes]:
+    # Own session: the response body is produced after the endpoint returns
+    async with async_session() as db:
+        rows = await (db.stream_scalars(stmt) if scalars else db.stream(stmt))
+        yield b"["
+        prefix = b""
+        async for row in rows:
+            yield prefix + dump_json(to_dict(row))
+            prefix = b","
+        yield b"]"
+
+
+def json_array_response(
+    stmt: Select, to_dict: Callable[[Any], dict], scalars: bool = True,
+) -> StreamingResponse:
+    """Stream the rows of ``stmt`` as a JSON array, each mapped by ``to_dict``.
+
+    With ``scalars`` (the default) ``to_dict`` gets the first entity of each
+    row; otherwise it gets the whole ``Row``.
+    """
+    return StreamingResponse(
+        _stream_rows(stmt, to_dict, scalars), media_type="application/json",
+    )
+
+
+def encode_cursor(values: dict) -> str:
+    """Opaque, URL-safe cursor for the keyset values of a page's last row."""
+    return base64.urlsafe_b64encode(dump_json(values)).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Inverse of ``encode_cursor``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error):
+        values = None
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+async def _stream_page(
+    stmt: Select, to_dict: Callable[[Any], dict], limit: int,
+    cursor_of: Callable[[dict], dict],
+) -> AsyncIterator[bytes]:
+    async with async_session() as db:
+        # One extra row tells us whether another page follows
+        rows = await db.stream(stmt.limit(limit + 1))
+        yield b'{"data":['
+        prefix = b""
+        sent = 0
+        last: Optional[dict] = None
+        next_cursor = None
+        async for row in rows:
+            if sent == limit:
+                next_cursor = encode_cursor(cursor_of(last))
+                break
+            last = to_dict(row)
+            yield prefix + dump_json(last)
+            prefix = b","
+            sent += 1
+        await rows.close()
+        yield b'],"next_cursor":' + dump_json(next_cursor) + b"}"
+
+
+def json_page_response(
+    stmt: Select, to_dict: Callable[[Any], dict], limit: int,
+    cursor_of: Callable[[dict], dict],
+) -> StreamingResponse:
+    """Stream up to ``limit`` rows of ``stmt`` as one keyset page.
+
+    ``stmt`` must already be ordered and filtered past the incoming cursor;
+    ``cursor_of`` picks the keyset values out of the last row's dict.
+    """
+    return StreamingResponse(
+        _stream_page(stmt, to_dict, limit, cursor_of), media_type="application/json",
+    )
@@ -1,10 +1,22 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
+import hashlib
+import time
 
 import bcrypt
+# New hashes use argon2 when installed (much cheaper to verify than bcrypt at
+# equivalent strength); bcrypt hashes keep verifying and are upgraded on login
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    _argon2 = PasswordHasher()
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import jwt
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,42 +29,100 @@ ACTIVITY_THROTTLE_MINUTES = 15
 security = HTTPBearer()
 
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
+# The secret is fixed for the life of the process; bind it once
+_JWT_SECRET = get_settings().jwt_secret
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Validated tokens are remembered for TOKEN_CACHE_TTL seconds so a hit skips
+# both jwt.decode and the users SELECT. Entries hold session-free copies of the
+# user, so an is_active/is_admin change takes up to TOKEN_CACHE_TTL to apply.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAX = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[User, float]]" = OrderedDict()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith("$argon2"):
+        if not ARGON2_AVAILABLE:
+            return False
+        try:
+            return _argon2.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
 def hash_password(password: str) -> str:
+    if ARGON2_AVAILABLE:
+        return _argon2.hash(password)
     return bcrypt.hashpw(
         password.encode("utf-8"), bcrypt.gensalt()
     ).decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when a verified hash should be replaced with a fresh hash_password()."""
+    if not ARGON2_AVAILABLE:
+        return False
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return _argon2.check_needs_rehash(hashed_password)
+
+
 def create_access_token(user_id: int, email: str) -> str:
-    settings = get_settings()
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": str(user_id), "email": email, "exp": expire}
-    return jwt.encode(payload, settings.jwt_secret, algorithm=ALGORITHM)
+    return jwt.encode(payload, _JWT_SECRET, algorithm=ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
-    settings = get_settings()
-    return jwt.decode(token, settings.jwt_secret, algorithms=[ALGORITHM])
+    return jwt.decode(token, _JWT_SECRET, algorithms=_ALGORITHMS)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = credentials.credentials
+def _snapshot(user: User) -> User:
+    """Copy of a user row that belongs to no session, safe to share between requests."""
+    return User(**{c.key: getattr(user, c.key) for c in User.__table__.columns})
+
+
+def _cached_user(key: bytes) -> Optional[User]:
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    user, deadline = entry
+    if time.monotonic() >= deadline:
+        del _token_cache[key]
+        return None
+    _token_cache.move_to_end(key)
+    return user
+
+
+def _cache_user(key: bytes, user: User, exp: float) -> None:
+    # Near-expiry tokens keep going through jwt.decode so they lapse on time
+    if exp - time.time() < TOKEN_CACHE_TTL:
+        return
+    _token_cache[key] = (user, time.monotonic() + TOKEN_CACHE_TTL)
+    while len(_token_cache) > TOKEN_CACHE_MAX:
+        _token_cache.popitem(last=False)
+
+
+async def _user_for_token(token: str, db: AsyncSession) -> User:
+    """Resolve a bearer token to its (active) user, from the cache when possible.
+
+    Raises:
+        HTTPException: 401 if the token is invalid/expired or the user is gone.
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    user = _cached_user(key)
+    if user is not None:
+        return user
+
     try:
         payload = decode_token(token)
         user_id = int(payload["sub"])
-    except (JWTError, KeyError, ValueError):
+    except (jwt.InvalidTokenError, KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -66,13 +136,29 @@ async def get_current_user(
             detail="User not found",
         )
 
+    user = _snapshot(user)
+    _cache_user(key, user, payload.get("exp", 0))
+    return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    user = await _user_for_token(credentials.credentials, db)
+
     # Throttled activity tracking (use naive UTC to match DB's timestamp-without-tz)
     now = datetime.utcnow()
     if user.last_active_at is None or (now - user.last_active_at) > timedelta(minutes=ACTIVITY_THROTTLE_MINUTES):
+        await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(last_active_at=now, visit_count=User.visit_count + 1)
+        )
+        await db.commit()
+        # Also updates the cached copy, so the next hit doesn't write again
         user.last_active_at = now
         user.visit_count = (user.visit_count or 0) + 1
-        await db.commit()
-        await db.refresh(user)
 
     return user
 
@@ -97,13 +183,6 @@ async def get_optional_user(
     if credentials is None:
         return None
     try:
-        payload = decode_token(credentials.credentials)
-        user_id = int(payload["sub"])
-    except (JWTError, KeyError, ValueError):
+        return await _user_for_token(credentials.credentials, db)
+    except HTTPException:
         return None
-
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None or not user.is_active:
-        return None
-    return user
@@ -1,16 +1,44 @@
-import os
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
-    database_url: str = os.environ.get(
-        "DATABASE_URL",
-        ""
-    )
+    # Every field is read from the environment variable of the same name
+    # (case-insensitive), then from .env
+    database_url: str = ""
+    model_path: str = "models/fantasy_predictor_v1.pkl"
+
+    # Auth settings
+    jwt_secret: str = ""
+    google_client_id: str = ""
+
+    # GitHub Issues
+    github_token: str = ""
+    github_repo: str = ""
+
+    # CORS
+    cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
+
+    # Scraping: max Oddschecker pages loaded at once (each on its own browser context)
+    scrape_concurrency: int = 4
+    # Seconds a successfully saved (match, market) is reused before re-scraping
+    scrape_cache_ttl: int = 1800
+
+    # Postgres connection pool (per worker); scrapers and streamed responses
+    # each hold a connection for a while, so size above SQLAlchemy's 5 + 10
+    db_pool_size: int = 20
+    db_pool_overflow: int = 40
+
+    model_config = SettingsConfigDict(env_file=".env")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @cached_property
+    def cors_origin_set(self) -> frozenset[str]:
+        """``cors_origins`` parsed once into a set (blank entries dropped)."""
+        return frozenset(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
+    @model_validator(mode="after")
+    def _check_required(self) -> "Settings":
         if not self.database_url:
             raise ValueError(
                 "DATABASE_URL environment variable is required. "
@@ -26,22 +54,10 @@ class Settings(BaseSettings):
                 "JWT_SECRET environment variable must be set to a strong, unique value. "
                 "Generate one with: python -c \"import secrets; print(secrets.token_urlsafe(64))\""
             )
-    model_path: str = "models/fantasy_predictor_v1.pkl"
-
-    # Auth settings
-    jwt_secret: str = os.environ.get("JWT_SECRET", "")
-    google_client_id: str = os.environ.get("GOOGLE_CLIENT_ID", "")
-
-    # GitHub Issues
-    github_token: str = os.environ.get("GITHUB_TOKEN", "")
-    github_repo: str = os.environ.get("GITHUB_REPO", "")
-
-    # CORS
-    cors_origins: str = os.environ.get("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
-
-    model_config = SettingsConfigDict(env_file=".env")
+        return self
 
 
 @lru_cache()
 def get_settings() -> Settings:
+    # Tests that change the environment can call get_settings.cache_clear()
     return Settings()
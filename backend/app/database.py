@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -6,7 +7,24 @@ from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=False)
+if settings.database_url.startswith("postgresql+asyncpg://"):
+    engine = create_async_engine(
+        settings.database_url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_pool_overflow,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,  # reuse the warm connections, let the rest idle out
+        connect_args={
+            # Our queries are short OLTP lookups; JIT compile time only hurts them
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": 1024,
+        },
+    )
+else:
+    # SQLite (tests/local) keeps SQLAlchemy's pool defaults
+    engine = create_async_engine(settings.database_url, echo=False)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -22,6 +40,23 @@ async def get_db():
             await session.close()
 
 
+# Indexes added after their tables already existed; create_all only builds
+# indexes for tables it creates (see migrations/005-007). The DDL comes from
+# the Index definitions on the models.
+_LATE_INDEXES = frozenset({
+    "ix_odds_try_scorer_season_round",
+    "ix_players_country",
+    "ix_six_nations_stats_match_date_id",
+    "ix_club_stats_match_date_id",
+    "ix_odds_season_round",
+    "ix_fantasy_prices_season_round",
+    "ix_team_selections_season_round",
+    "ix_predictions_season_round",
+    "ix_six_nations_stats_season_round",
+    "ix_fantasy_round_stats_season_round",
+})
+
+
 async def init_db():
     try:
         async with engine.begin() as conn:
@@ -30,14 +65,27 @@ async def init_db():
         # Ignore race condition when multiple workers create tables simultaneously
         pass
 
-    # Lightweight column migrations (no Alembic)
+    # Lightweight column migrations (no Alembic). One statement takes the
+    # users table lock once; warm starts see the columns and skip DDL entirely.
     async with engine.begin() as conn:
-        await conn.execute(text(
-            "ALTER TABLE users ADD COLUMN IF NOT EXISTS is_admin BOOLEAN NOT NULL DEFAULT false"
-        ))
-        await conn.execute(text(
-            "ALTER TABLE users ADD COLUMN IF NOT EXISTS last_login_at TIMESTAMP"
-        ))
-        await conn.execute(text(
-            "ALTER TABLE users ADD COLUMN IF NOT EXISTS login_count INTEGER NOT NULL DEFAULT 0"
+        present = await conn.scalar(text(
+            "SELECT count(*) FROM information_schema.columns "
+            "WHERE table_name = 'users' "
+            "AND column_name IN ('is_admin', 'last_login_at', 'login_count')"
         ))
+        if present < 3:
+            await conn.execute(text(
+                "ALTER TABLE users"
+                " ADD COLUMN IF NOT EXISTS is_admin BOOLEAN NOT NULL DEFAULT false,"
+                " ADD COLUMN IF NOT EXISTS last_login_at TIMESTAMP,"
+                " ADD COLUMN IF NOT EXISTS login_count INTEGER NOT NULL DEFAULT 0"
+            ))
+
+        existing = set((await conn.scalars(
+            text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)"),
+            {"names": list(_LATE_INDEXES)},
+        )).all())
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in _LATE_INDEXES and index.name not in existing:
+                    await conn.execute(CreateIndex(index, if_not_exists=True))
@@ -32,18 +32,46 @@ SIX_NATIONS_2026: dict[tuple[int, int, str, str], datetime] = {
 
 MATCH_PLAYED_BUFFER = timedelta(hours=2)
 
+# lowercased team name -> the casing used in SIX_NATIONS_2026
+_CANON: dict[str, str] = {
+    team.lower(): team for _, _, home, away in SIX_NATIONS_2026 for team in (home, away)
+}
+
+
+def _group_by_round() -> dict[tuple[int, int], list[tuple[str, str, datetime]]]:
+    """(season, round) -> [(home, away, kickoff), ...] sorted by kickoff."""
+    rounds: dict[tuple[int, int], list[tuple[str, str, datetime]]] = {}
+    for (season, rnd, home, away), kickoff in SIX_NATIONS_2026.items():
+        rounds.setdefault((season, rnd), []).append((home, away, kickoff))
+    for fixtures in rounds.values():
+        fixtures.sort(key=lambda f: f[2])
+    return rounds
+
+
+# The schedule is static, so per-round lists are built once
+_ROUND_FIXTURES = _group_by_round()
+
+# POSIX time after which a match (or a round's last match) counts as played:
+# per-call checks become one float comparison instead of datetime arithmetic
+_PLAYED_AFTER_TS: dict[tuple[int, int, str, str], float] = {
+    key: (kickoff + MATCH_PLAYED_BUFFER).timestamp()
+    for key, kickoff in SIX_NATIONS_2026.items()
+}
+_ROUND_PLAYED_AFTER_TS: dict[tuple[int, int], float] = {
+    key: (fixtures[-1][2] + MATCH_PLAYED_BUFFER).timestamp()
+    for key, fixtures in _ROUND_FIXTURES.items()
+}
+
 
 def _normalize_key(
     season: int, round_num: int, home: str, away: str,
 ) -> Optional[tuple[int, int, str, str]]:
     """Find the canonical key, case-insensitive on team names."""
-    home_l = home.lower()
-    away_l = away.lower()
-    for key in SIX_NATIONS_2026:
-        if (key[0] == season and key[1] == round_num
-                and key[2].lower() == home_l and key[3].lower() == away_l):
-            return key
-    return None
+    key = (season, round_num, home, away)
+    if key in SIX_NATIONS_2026:  # already canonical casing (the usual case)
+        return key
+    key = (season, round_num, _CANON.get(home.lower(), home), _CANON.get(away.lower(), away))
+    return key if key in SIX_NATIONS_2026 else None
 
 
 def is_match_played(season: int, round_num: int, home: str, away: str) -> bool:
@@ -51,18 +79,21 @@ def is_match_played(season: int, round_num: int, home: str, away: str) -> bool:
     key = _normalize_key(season, round_num, home, away)
     if key is None:
         return False
-    kickoff = SIX_NATIONS_2026[key]
-    return _utcnow() > kickoff + MATCH_PLAYED_BUFFER
+    return _utcnow().timestamp() > _PLAYED_AFTER_TS[key]
 
 
 def get_upcoming_matches(
     season: int, round_num: int,
 ) -> list[tuple[int, int, str, str]]:
     """Return fixture keys for matches in this round that haven't been played yet."""
+    now = _utcnow().timestamp()
     return [
-        key for key in SIX_NATIONS_2026
-        if key[0] == season and key[1] == round_num
-        and not is_match_played(season, round_num, key[2], key[3])
+        key
+        for key in (
+            (season, round_num, home, away)
+            for home, away, _ in _ROUND_FIXTURES.get((season, round_num), ())
+        )
+        if now <= _PLAYED_AFTER_TS[key]
     ]
 
 
@@ -70,13 +101,7 @@ def get_round_fixtures(
     season: int, round_num: int,
 ) -> list[tuple[str, str, datetime]]:
     """Return (home, away, kickoff) for all matches in a round, sorted by kickoff."""
-    fixtures = [
-        (key[2], key[3], SIX_NATIONS_2026[key])
-        for key in SIX_NATIONS_2026
-        if key[0] == season and key[1] == round_num
-    ]
-    fixtures.sort(key=lambda f: f[2])
-    return fixtures
+    return list(_ROUND_FIXTURES.get((season, round_num), ()))
 
 
 def get_current_round(season: int = 2026) -> int:
@@ -85,12 +110,9 @@ def get_current_round(season: int = 2026) -> int:
     Returns the earliest round that still has unplayed matches,
     or the last round if everything has been played.
     """
-    now = _utcnow()
+    now = _utcnow().timestamp()
     for rnd in range(1, 6):
-        fixtures = get_round_fixtures(season, rnd)
-        if not fixtures:
-            continue
-        last_kickoff = max(ko for _, _, ko in fixtures)
-        if now < last_kickoff + MATCH_PLAYED_BUFFER:
+        played_after = _ROUND_PLAYED_AFTER_TS.get((season, rnd))
+        if played_after is not None and now < played_after:
             return rnd
     return 5
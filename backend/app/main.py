@@ -1,28 +1,60 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import get_settings
 from app.database import init_db
+from app.scrapers import browser_pool
+from app.services import http_client
+from app.services.scrape_run_batcher import batcher as scrape_run_batcher
 from app.api import api_router
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        return response
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+}
+
+
+class SecurityHeadersMiddleware:
+    """Set the security headers on every HTTP response.
+
+    Plain ASGI rather than BaseHTTPMiddleware: it only edits the
+    response-start message, so there's no per-request task group and
+    streamed bodies pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    scrape_run_batcher.start()
     yield
     # Shutdown
+    await scrape_run_batcher.stop()
+    await browser_pool.shutdown()
+    await http_client.shutdown()
 
 
 settings = get_settings()
@@ -37,10 +69,11 @@ app = FastAPI(
 # Security headers
 app.add_middleware(SecurityHeadersMiddleware)
 
-# CORS middleware — origins configurable via CORS_ORIGINS env var (comma-separated)
+# CORS middleware — origins configurable via CORS_ORIGINS env var (comma-separated).
+# A frozenset makes the per-request origin check a hash lookup.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[o.strip() for o in settings.cors_origins.split(",") if o.strip()],
+    allow_origins=settings.cors_origin_set,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
@@ -4,6 +4,7 @@ from app.models.odds import Odds, MatchOdds
 from app.models.prediction import Prediction, FantasyPrice, TeamSelection
 from app.models.user import User
 from app.models.scrape_run import ScrapeRun
+from app.models.scrape_job import ScrapeJob
 
 __all__ = [
     "Player",
@@ -18,4 +19,5 @@ __all__ = [
     "TeamSelection",
     "User",
     "ScrapeRun",
+    "ScrapeJob",
 ]
@@ -1,16 +1,23 @@
 from datetime import datetime, date
 from typing import Optional
-from decimal import Decimal
-from sqlalchemy import String, DateTime, Date, Integer, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy import String, DateTime, Date, Integer, ForeignKey, Numeric, UniqueConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.time import utcnow_naive
 
 
 class Odds(Base):
     __tablename__ = "odds"
     __table_args__ = (
         UniqueConstraint('player_id', 'season', 'round', name='uq_odds_player_season_round'),
+        # The unique constraint leads with player_id, so it can't serve per-round scans
+        Index('ix_odds_season_round', 'season', 'round'),
+        # Per-round try scorer lookups (missing-market detection)
+        Index(
+            'ix_odds_try_scorer_season_round', 'season', 'round', 'player_id',
+            postgresql_where=text('anytime_try_scorer IS NOT NULL'),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -19,15 +26,16 @@ class Odds(Base):
     round: Mapped[int] = mapped_column(Integer, nullable=False)
     match_date: Mapped[date] = mapped_column(Date, nullable=False)
 
-    # Try scorer odds (decimal format)
-    anytime_try_scorer: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    first_try_scorer: Mapped[Optional[Decimal]] = mapped_column(Numeric(8, 2), nullable=True)
-    two_plus_tries: Mapped[Optional[Decimal]] = mapped_column(Numeric(8, 2), nullable=True)
+    # Try scorer odds (decimal format). Stored as NUMERIC but read back as
+    # float: they only feed probability math and JSON, never money sums
+    anytime_try_scorer: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    first_try_scorer: Mapped[Optional[float]] = mapped_column(Numeric(8, 2, asdecimal=False), nullable=True)
+    two_plus_tries: Mapped[Optional[float]] = mapped_column(Numeric(8, 2, asdecimal=False), nullable=True)
 
     # Player of match
-    player_of_match: Mapped[Optional[Decimal]] = mapped_column(Numeric(8, 2), nullable=True)
+    player_of_match: Mapped[Optional[float]] = mapped_column(Numeric(8, 2, asdecimal=False), nullable=True)
 
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
     source: Mapped[str] = mapped_column(String(50), default="oddschecker")
 
     player: Mapped["Player"] = relationship("Player", back_populates="odds")
@@ -47,21 +55,21 @@ class MatchOdds(Base):
     away_team: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Match result odds
-    home_win: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    away_win: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    draw: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
+    home_win: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    away_win: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    draw: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
 
     # Totals
-    over_under_line: Mapped[Optional[Decimal]] = mapped_column(Numeric(4, 1), nullable=True)
-    over_odds: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    under_odds: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
+    over_under_line: Mapped[Optional[float]] = mapped_column(Numeric(4, 1, asdecimal=False), nullable=True)
+    over_odds: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    under_odds: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
 
     # Handicap
-    handicap_line: Mapped[Optional[Decimal]] = mapped_column(Numeric(4, 1), nullable=True)
-    home_handicap_odds: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    away_handicap_odds: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
+    handicap_line: Mapped[Optional[float]] = mapped_column(Numeric(4, 1, asdecimal=False), nullable=True)
+    home_handicap_odds: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    away_handicap_odds: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
 
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
 
 
 from app.models.player import Player
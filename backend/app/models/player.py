@@ -4,6 +4,7 @@ from sqlalchemy import String, Boolean, DateTime, Date, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.time import utcnow_naive
 
 
 class Player(Base):
@@ -12,13 +13,13 @@ class Player(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     external_id: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, unique=True)  # rugbypy player_id
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    country: Mapped[str] = mapped_column(String(50), nullable=False)
+    country: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     fantasy_position: Mapped[str] = mapped_column(String(50), nullable=False)
     is_kicker: Mapped[bool] = mapped_column(Boolean, default=False)
     height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # cm
     weight: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # kg
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive, onupdate=utcnow_naive)
 
     # Relationships
     clubs: Mapped[List["PlayerClub"]] = relationship("PlayerClub", back_populates="player")
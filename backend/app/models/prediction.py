@@ -1,10 +1,10 @@
 from datetime import datetime
 from typing import Optional
-from decimal import Decimal
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.time import utcnow_naive
 
 
 class FantasyPrice(Base):
@@ -14,12 +14,15 @@ class FantasyPrice(Base):
     player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), nullable=False)
     season: Mapped[int] = mapped_column(Integer, nullable=False)
     round: Mapped[int] = mapped_column(Integer, nullable=False)
-    price: Mapped[Decimal] = mapped_column(Numeric(5, 1), nullable=False)
-    ownership_pct: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
+    price: Mapped[float] = mapped_column(Numeric(5, 1, asdecimal=False), nullable=False)
+    ownership_pct: Mapped[Optional[float]] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=True)
     availability: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
 
-    __table_args__ = (UniqueConstraint("player_id", "season", "round", name="uq_player_season_round"),)
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", "round", name="uq_player_season_round"),
+        Index("ix_fantasy_prices_season_round", "season", "round"),
+    )
 
     player: Mapped["Player"] = relationship("Player", back_populates="prices")
 
@@ -34,9 +37,12 @@ class TeamSelection(Base):
     squad_position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_starting: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     actual_position: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
 
-    __table_args__ = (UniqueConstraint("player_id", "season", "round", name="uq_selection_player_season_round"),)
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", "round", name="uq_selection_player_season_round"),
+        Index("ix_team_selections_season_round", "season", "round"),
+    )
 
     player: Mapped["Player"] = relationship("Player", back_populates="team_selections")
 
@@ -48,11 +54,16 @@ class Prediction(Base):
     player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), nullable=False)
     season: Mapped[int] = mapped_column(Integer, nullable=False)
     round: Mapped[int] = mapped_column(Integer, nullable=False)
-    predicted_points: Mapped[Decimal] = mapped_column(Numeric(6, 2), nullable=False)
-    confidence_lower: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
-    confidence_upper: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
+    predicted_points: Mapped[float] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=False)
+    confidence_lower: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
+    confidence_upper: Mapped[Optional[float]] = mapped_column(Numeric(6, 2, asdecimal=False), nullable=True)
     model_version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
+
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", "round", name="uq_prediction_player_season_round"),
+        Index("ix_predictions_season_round", "season", "round"),
+    )
 
     player: Mapped["Player"] = relationship("Player", back_populates="predictions")
 
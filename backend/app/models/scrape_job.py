@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy.dialects.postgresql import JSON
+from app.database import Base
+from app.utils.time import utcnow
+
+
+class ScrapeJob(Base):
+    """Persisted snapshot of a background scrape job's status (see app.api.job_store)."""
+    __tablename__ = "scrape_jobs"
+
+    id = Column(String(36), primary_key=True)
+    # Embeds request-supplied team names, so unbounded
+    dedup_key = Column(Text, nullable=True, index=True)
+    status = Column(String(20), nullable=False, default="in_progress")
+    state = Column(JSON, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
@@ -1,7 +1,7 @@
-from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, DateTime, Float, Text
 from sqlalchemy.dialects.postgresql import JSON
 from app.database import Base
+from app.utils.time import utcnow
 
 
 class ScrapeRun(Base):
@@ -13,10 +13,10 @@ class ScrapeRun(Base):
     market_type = Column(String(20), nullable=False)
     match_slug = Column(String(100), nullable=True)
     status = Column(String(20), nullable=False, default="in_progress")
-    started_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     duration_seconds = Column(Float, nullable=True)
     result_summary = Column(JSON, nullable=True)
     warnings = Column(JSON, nullable=True)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
@@ -1,14 +1,20 @@
-from datetime import datetime, date, timezone
+from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
-from sqlalchemy import String, Boolean, DateTime, Date, Integer, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy import String, Boolean, DateTime, Date, Integer, ForeignKey, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.time import utcnow, utcnow_naive
 
 
 class SixNationsStats(Base):
     __tablename__ = "six_nations_stats"
+    __table_args__ = (
+        # Keyset pagination of the historical endpoint (match_date DESC, id DESC)
+        Index("ix_six_nations_stats_match_date_id", "match_date", "id"),
+        Index("ix_six_nations_stats_season_round", "season", "round"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), nullable=False)
@@ -53,13 +59,16 @@ class SixNationsStats(Base):
     # Calculated
     fantasy_points: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
 
     player: Mapped["Player"] = relationship("Player", back_populates="six_nations_stats")
 
 
 class ClubStats(Base):
     __tablename__ = "club_stats"
+    __table_args__ = (
+        Index("ix_club_stats_match_date_id", "match_date", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     player_id: Mapped[int] = mapped_column(ForeignKey("players.id"), nullable=False)
@@ -99,7 +108,7 @@ class ClubStats(Base):
     # Calculated
     fantasy_points: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
 
     player: Mapped["Player"] = relationship("Player", back_populates="club_stats")
 
@@ -108,6 +117,7 @@ class FantasyRoundStats(Base):
     __tablename__ = "fantasy_round_stats"
     __table_args__ = (
         UniqueConstraint("player_id", "season", "round", name="uq_fantasy_round_stats_player_season_round"),
+        Index("ix_fantasy_round_stats_season_round", "season", "round"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -148,7 +158,7 @@ class FantasyRoundStats(Base):
     # Calculated
     fantasy_points: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
 
-    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
     player: Mapped["Player"] = relationship("Player", back_populates="fantasy_round_stats")
 
@@ -1,6 +1,6 @@
-from datetime import datetime
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from app.database import Base
+from app.utils.time import utcnow_naive
 
 
 class User(Base):
@@ -14,7 +14,7 @@ class User(Base):
     avatar_url = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False, nullable=False, server_default="false")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow_naive)
     last_login_at = Column(DateTime, nullable=True)
     login_count = Column(Integer, default=0, nullable=False, server_default="0")
     last_active_at = Column(DateTime(timezone=True), nullable=True)
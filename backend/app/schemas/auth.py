@@ -16,8 +16,7 @@ class RegisterRequest(BaseModel):
     @field_validator("name")
     @classmethod
     def name_not_empty(cls, v: str) -> str:
-        v = v.strip()
-        if not v or len(v) > 100:
+        if not 1 <= len(v := v.strip()) <= 100:
             raise ValueError("Name must be between 1 and 100 characters")
         return v
 
@@ -31,11 +30,6 @@ class GoogleAuthRequest(BaseModel):
     credential: str  # Google ID token from frontend
 
 
-class AuthResponse(BaseModel):
-    token: str
-    user: "UserResponse"
-
-
 class UserResponse(BaseModel):
     id: int
     email: str
@@ -44,3 +38,8 @@ class UserResponse(BaseModel):
     is_admin: bool = False
 
     model_config = {"from_attributes": True}
+
+
+class AuthResponse(BaseModel):
+    token: str
+    user: UserResponse
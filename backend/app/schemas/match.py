@@ -1,6 +1,6 @@
 from typing import Optional, List
 from datetime import date, datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 
 
 class MatchTryScorer(BaseModel):
@@ -89,21 +89,23 @@ class ScrapeRunSummary(BaseModel):
     status: str
     started_at: datetime
     completed_at: Optional[datetime] = None
-    duration_seconds: Optional[float] = None
-    warnings: Optional[list] = None
+    warnings: list[ValidationWarning] = []
     result_summary: Optional[dict] = None
 
+    @computed_field
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        if self.completed_at is None:
+            return None
+        return (self.completed_at - self.started_at).total_seconds()
+
 
 class RoundScrapeStatusResponse(BaseModel):
     season: int
     round: int
-    # Existing fields (keep as-is)
-    matches: List[MatchScrapeStatus]
     missing_markets: List[str]
-    has_prices: bool = False
     price_count: int = 0
     availability_known: int = 0
-    availability_unknown: int = 0
     # New enriched fields
     enriched_matches: list[EnrichedMatchScrapeStatus] = []
     fantasy_prices: Optional[DatasetStatus] = None
@@ -112,6 +114,33 @@ class RoundScrapeStatusResponse(BaseModel):
     last_scrape_run: Optional[ScrapeRunSummary] = None
     scrape_history: list[ScrapeRunSummary] = []
 
+    @computed_field
+    @property
+    def has_prices(self) -> bool:
+        return self.price_count > 0
+
+    @computed_field
+    @property
+    def availability_unknown(self) -> int:
+        return self.price_count - self.availability_known
+
+    @computed_field
+    @property
+    def matches(self) -> List[MatchScrapeStatus]:
+        """Legacy per-match flags, projected from enriched_matches."""
+        return [
+            MatchScrapeStatus(
+                home_team=m.home_team,
+                away_team=m.away_team,
+                match_date=m.match_date,
+                has_handicap=m.handicaps.status != "missing",
+                has_totals=m.totals.status != "missing",
+                has_try_scorer=m.try_scorer.status != "missing",
+                try_scorer_count=m.try_scorer_count,
+            )
+            for m in self.enriched_matches
+        ]
+
 
 class TryScorerDetail(BaseModel):
     player_id: int
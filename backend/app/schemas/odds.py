@@ -1,14 +1,9 @@
-from typing import Optional, List, Dict, Any
+from typing import Literal, Optional, List, Dict, Any
 from datetime import date
 from pydantic import BaseModel, HttpUrl
-from enum import Enum
 
 
-class MarketType(str, Enum):
-    TRY_SCORER = "try_scorer"
-    MATCH_TOTALS = "match_totals"
-    HANDICAPS = "handicaps"
-    TOTAL_POINTS = "total_points"
+MarketType = Literal["try_scorer", "match_totals", "handicaps", "total_points"]
 
 
 class OddsScrapeRequest(BaseModel):
@@ -25,6 +20,7 @@ class AllMatchOddsScrapeRequest(BaseModel):
     """Request model for scraping all match odds (auto-discovers matches)."""
     season: int = 2026
     round: int = 1
+    force_refresh: bool = False  # bypass the recent-scrape cache
 
 
 class OddsScrapeResponse(BaseModel):
@@ -1,33 +1,18 @@
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
-from enum import Enum
 
 
-class Country(str, Enum):
-    IRELAND = "Ireland"
-    ENGLAND = "England"
-    FRANCE = "France"
-    WALES = "Wales"
-    SCOTLAND = "Scotland"
-    ITALY = "Italy"
+# Literals rather than str Enums: pydantic-core checks them with a set lookup
+# and handlers get plain strings, so no .value / Enum(...) round trips
+Country = Literal["Ireland", "England", "France", "Wales", "Scotland", "Italy"]
 
+Position = Literal[
+    "prop", "hooker", "second_row", "back_row",
+    "scrum_half", "out_half", "centre", "back_3",
+]
 
-class Position(str, Enum):
-    PROP = "prop"
-    HOOKER = "hooker"
-    SECOND_ROW = "second_row"
-    BACK_ROW = "back_row"
-    SCRUM_HALF = "scrum_half"
-    OUT_HALF = "out_half"
-    CENTRE = "centre"
-    BACK_3 = "back_3"
-
-
-class League(str, Enum):
-    URC = "urc"
-    PREMIERSHIP = "premiership"
-    TOP_14 = "top_14"
+League = Literal["urc", "premiership", "top_14"]
 
 
 class PlayerBase(BaseModel):
@@ -0,0 +1,77 @@
+"""
+Shared headless Chromium instances for the scrape background tasks.
+
+Launching Chromium costs several seconds, so the API keeps one browser per
+scraper kind alive for the lifetime of the process. Each scrape creates its
+own BrowserContext on the shared browser and closes that context when done —
+never the browser itself. ``shutdown()`` is called from the app lifespan.
+"""
+
+from typing import Dict, List
+import asyncio
+import logging
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+logger = logging.getLogger(__name__)
+
+# Launch flags per scraper kind (headless only — login flows launch their own)
+LAUNCH_ARGS: Dict[str, List[str]] = {
+    "oddschecker": [
+        "--disable-blink-features=AutomationControlled",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-infobars",
+        "--window-size=1920,1080",
+    ],
+    "fantasy": [
+        "--disable-blink-features=AutomationControlled",
+        "--no-sandbox",
+    ],
+}
+
+_playwright: Playwright | None = None
+_browsers: Dict[str, Browser] = {}
+_lock = asyncio.Lock()
+
+
+async def acquire(kind: str) -> Browser:
+    """Return the shared browser for ``kind``, launching it on first use."""
+    global _playwright
+
+    browser = _browsers.get(kind)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    async with _lock:
+        browser = _browsers.get(kind)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+
+        logger.info(f"Launching shared {kind} browser")
+        browser = await _playwright.chromium.launch(
+            headless=True, args=LAUNCH_ARGS[kind],
+        )
+        _browsers[kind] = browser
+        return browser
+
+
+async def shutdown():
+    """Close every pooled browser and stop Playwright."""
+    global _playwright
+
+    async with _lock:
+        for kind, browser in list(_browsers.items()):
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {kind} browser: {e}")
+        _browsers.clear()
+
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
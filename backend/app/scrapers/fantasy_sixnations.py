@@ -20,6 +20,7 @@ from playwright.async_api import (
     Page,
     Browser,
     BrowserContext,
+    TimeoutError as PlaywrightTimeout,
 )
 
 from app.scrapers.base import BaseScraper
@@ -86,11 +87,106 @@ COUNTRY_FROM_IMAGE = {
     "scotland": "Scotland",
     "italy": "Italy",
 }
+_COUNTRY_IMAGE_RE = re.compile("|".join(COUNTRY_FROM_IMAGE), re.IGNORECASE)
+
+# Resource types the scraper never needs: it only reads DOM text, and the
+# country-from-image fallback uses the img src attribute, not the image
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Cookie consent / overlay buttons. Joined into one selector so each frame
+# is probed with a single call; ":visible" stands in for is_visible()
+OVERLAY_SELECTORS = [
+    'button:has-text("Accept")',
+    'button:has-text("Accept All")',
+    'button:has-text("Accept all")',
+    'button:has-text("OK")',
+    'button:has-text("Got it")',
+    '#onetrust-accept-btn-handler',
+    '.cc-btn.cc-allow',
+    '#didomi-notice-agree-button',
+]
+OVERLAY_SELECTOR = ", ".join(f"{sel}:visible" for sel in OVERLAY_SELECTORS)
+# Narrower set re-checked while the user is logging in, so buttons like
+# "OK" on the sign-in pages are left alone
+LOGIN_OVERLAY_SELECTOR = ", ".join(
+    f"{sel}:visible" for sel in (
+        'button:has-text("Accept")',
+        'button:has-text("Accept All")',
+        '#onetrust-accept-btn-handler',
+    )
+)
 
 BASE_URL = "https://fantasy.sixnationsrugby.com"
 GAME_URL = f"{BASE_URL}/m6n/#/game/play/me"
 
 
+# Reads every field _extract_player needs from all sportif-item cards in a
+# single browser-side pass. Missing elements come back as null.
+EXTRACT_PLAYERS_JS = """() => {
+    const text = (el, sel) => {
+        const found = el.querySelector(sel);
+        return found ? found.innerText.trim() : null;
+    };
+    const attr = (el, sel, name) => {
+        const found = el.querySelector(sel);
+        return found ? found.getAttribute(name) : null;
+    };
+    return Array.from(document.querySelectorAll('sportif-item'), el => ({
+        name: text(el, '.nom-sportif'),
+        position: text(el, '.position'),
+        country: text(el, '.info-match-club.club-sportif'),
+        img: attr(el, 'img.image-sportif', 'src'),
+        price: text(el, '.valeur-sportif-nb'),
+        pct: text(el, '.sportif-data-value-pourcentage'),
+        opp: text(el, '.info-match-club.club-adversaire span'),
+        icon: text(el, '.info-match-club.club-adversaire mat-icon'),
+        forme: attr(el, 'sportif-infos-forme .forme', 'class'),
+    }));
+}"""
+
+
+# True once the first card's name differs from ``prev`` (the page re-rendered)
+FIRST_NAME_CHANGED_JS = """(prev) => {
+    const el = document.querySelector('sportif-item .nom-sportif');
+    return el !== null && el.innerText.trim() !== prev;
+}"""
+
+
+async def _abort_unneeded(route):
+    """Context route handler: drop BLOCKED_RESOURCE_TYPES, pass the rest through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+NEXT_BUTTON_SELECTOR = 'button.mat-mdc-paginator-navigation-next, button[aria-label="Next"]'
+
+# False when the paginator's next button is missing or disabled: aria-disabled
+# "true" on the last page, the exact "mat-mdc-button-disabled" class (not
+# "-disabled-interactive"), or the HTML disabled attribute
+NEXT_BUTTON_ENABLED_JS = """(selector) => {
+    const btn = document.querySelector(selector);
+    return btn !== null
+        && btn.getAttribute('aria-disabled') !== 'true'
+        && !btn.classList.contains('mat-mdc-button-disabled')
+        && !btn.hasAttribute('disabled');
+}"""
+
+_NUMBER_RE = re.compile(r'[\d.]+')
+
+
+def _parse_number(text: Optional[str]) -> Optional[float]:
+    """Parse a price / percentage label, tolerating surrounding symbols."""
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        match = _NUMBER_RE.search(text)
+        return float(match.group()) if match else None
+
+
 class SessionExpiredError(Exception):
     """Raised when headless scrape fails because no valid session exists."""
     pass
@@ -127,12 +223,20 @@ class FantasySixNationsScraper(BaseScraper):
 
     LOGIN_WAIT_TIMEOUT = 300  # 5 minutes max to wait for login
     SESSION_CHECK_TIMEOUT = 30  # seconds to wait before declaring session stale
-
-    def __init__(self, headless: bool = False, session_path: Optional[Path] = None):
+    PAGE_CHANGE_TIMEOUT = 8  # seconds for the next page to render before treating it as the end
+
+    def __init__(
+        self,
+        headless: bool = False,
+        session_path: Optional[Path] = None,
+        browser: Optional[Browser] = None,
+    ):
         self._browser: Optional[Browser] = None
         self._playwright = None
         self._headless = headless
         self._session_path = session_path or DEFAULT_SESSION_PATH
+        # Long-lived browser owned by the caller (see app.scrapers.browser_pool)
+        self._shared_browser = browser
 
     async def _init_browser(self) -> Browser:
         """Initialize Playwright browser."""
@@ -158,8 +262,14 @@ class FantasySixNationsScraper(BaseScraper):
 
     async def _create_context(
         self, browser: Browser, storage_state: Optional[str] = None,
+        block_resources: bool = False,
     ) -> BrowserContext:
-        """Create browser context with realistic settings, optionally restoring session."""
+        """Create browser context with realistic settings, optionally restoring session.
+
+        With ``block_resources`` requests for images, fonts and media are
+        aborted. Only used when no one has to look at the page (the manual
+        login flow keeps everything so third-party sign-in pages render).
+        """
         kwargs: Dict[str, Any] = dict(
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -173,6 +283,8 @@ class FantasySixNationsScraper(BaseScraper):
         if storage_state:
             kwargs["storage_state"] = storage_state
         context = await browser.new_context(**kwargs)
+        if block_resources:
+            await context.route("**/*", _abort_unneeded)
         return context
 
     async def _save_session(self, context: BrowserContext):
@@ -186,7 +298,10 @@ class FantasySixNationsScraper(BaseScraper):
             logger.warning(f"Failed to save session: {e}")
 
     def _has_saved_session(self) -> bool:
-        return self._session_path.exists() and self._session_path.stat().st_size > 0
+        try:
+            return self._session_path.stat().st_size > 0
+        except FileNotFoundError:
+            return False
 
     async def scrape(self, url: str = GAME_URL, **kwargs) -> Dict[str, Any]:
         """
@@ -196,25 +311,28 @@ class FantasySixNationsScraper(BaseScraper):
         stale the browser context is recreated without the old state so the
         user can log in manually.
         """
+        has_session = self._has_saved_session()
+
         # Fail fast in headless mode if there's no saved session to restore
-        if self._headless and not self._has_saved_session():
+        if self._headless and not has_session:
             raise SessionExpiredError(
                 "No saved session — run scrape_fantasy_prices.py to log in first"
             )
 
-        self._browser = await self._init_browser()
+        self._browser = self._shared_browser or await self._init_browser()
+        context: Optional[BrowserContext] = None
 
         try:
             # --- try restoring a saved session first ---
-            context: Optional[BrowserContext] = None
             page: Optional[Page] = None
             logged_in = False
 
-            if self._has_saved_session():
+            if has_session:
                 print("\nRestoring saved session...")
                 logger.info("Restoring saved session")
                 context = await self._create_context(
                     self._browser, storage_state=str(self._session_path),
+                    block_resources=True,
                 )
                 page = await context.new_page()
                 await page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -257,12 +375,13 @@ class FantasySixNationsScraper(BaseScraper):
                 await self._dismiss_overlays(page)
                 await self._wait_for_player_list(page)
 
+                # Dismiss overlays again (OAuth redirect can bring them back);
+                # a restored session never leaves the game page, so only here
+                await self._dismiss_overlays(page)
+
             # Save session for next time (after successful login / session restore)
             await self._save_session(context)
 
-            # Dismiss overlays again (OAuth redirect can bring them back)
-            await self._dismiss_overlays(page)
-
             # Scrape all pages
             all_players = await self._scrape_all_pages(page)
 
@@ -279,13 +398,19 @@ class FantasySixNationsScraper(BaseScraper):
             logger.error(f"Error during scrape: {e}", exc_info=True)
             raise
         finally:
-            print("\nScraping complete. Closing browser...")
-            try:
-                await asyncio.wait_for(self._close_browser(), timeout=10)
-            except Exception:
-                logger.warning("Browser cleanup timed out, forcing close")
+            if self._shared_browser is not None:
+                # Leave the shared browser running for the next job
+                if context is not None:
+                    await context.close()
                 self._browser = None
-                self._playwright = None
+            else:
+                print("\nScraping complete. Closing browser...")
+                try:
+                    await asyncio.wait_for(self._close_browser(), timeout=10)
+                except Exception:
+                    logger.warning("Browser cleanup timed out, forcing close")
+                    self._browser = None
+                    self._playwright = None
 
         return result
 
@@ -293,111 +418,93 @@ class FantasySixNationsScraper(BaseScraper):
         """Dismiss cookie consent banners and other overlays."""
         await asyncio.sleep(2)
 
-        overlay_selectors = [
-            'button:has-text("Accept")',
-            'button:has-text("Accept All")',
-            'button:has-text("Accept all")',
-            'button:has-text("OK")',
-            'button:has-text("Got it")',
-            '#onetrust-accept-btn-handler',
-            '.cc-btn.cc-allow',
-            '#didomi-notice-agree-button',
-        ]
-
-        for selector in overlay_selectors:
+        # Main frame first, then iframes (page.frames starts with the main frame)
+        for frame in page.frames:
             try:
-                elem = await page.query_selector(selector)
-                if elem and await elem.is_visible():
-                    await elem.click()
-                    logger.info(f"Dismissed overlay: {selector}")
-                    print(f"Dismissed overlay: {selector}")
+                button = frame.locator(OVERLAY_SELECTOR).first
+                if await button.count():
+                    await button.click(timeout=2000)
+                    where = "" if frame == page.main_frame else " in iframe"
+                    logger.info(f"Dismissed overlay{where}")
+                    print(f"Dismissed overlay{where}")
                     await asyncio.sleep(1)
                     return
             except Exception:
                 continue
 
-        # Try iframes
-        try:
-            for frame in page.frames:
-                if frame == page.main_frame:
-                    continue
-                for selector in overlay_selectors:
-                    try:
-                        elem = await frame.query_selector(selector)
-                        if elem and await elem.is_visible():
-                            await elem.click()
-                            logger.info(f"Dismissed overlay in iframe: {selector}")
-                            await asyncio.sleep(1)
-                            return
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-
     async def _wait_for_player_list(self, page: Page, timeout: Optional[int] = None):
         """Wait for user to log in and the player list to be visible."""
         wait_seconds = timeout or self.LOGIN_WAIT_TIMEOUT
         print("Waiting for login and player list to load...")
 
-        for i in range(wait_seconds):
-            await asyncio.sleep(1)
+        # The browser watches for the player cards (and keeps waiting across
+        # the OAuth redirect); overlays are handled on the side meanwhile
+        side_task = asyncio.create_task(self._tend_login_page(page))
+        try:
+            await page.wait_for_selector(
+                "sportif-item", state="attached", timeout=wait_seconds * 1000,
+            )
+        except PlaywrightTimeout:
+            raise TimeoutError(
+                f"Timed out after {wait_seconds}s waiting for player list"
+            ) from None
+        finally:
+            side_task.cancel()
+
+        count = await page.locator("sportif-item").count()
+        logger.info(f"Player list detected with {count} items on first page")
+        print(f"Player list loaded! Found {count} players on current page.")
+        await asyncio.sleep(2)  # Let it fully render
 
+    async def _tend_login_page(self, page: Page):
+        """Runs until cancelled: dismiss overlays that reappear after the
+        login redirect and report progress while waiting."""
+        elapsed = 0
+        while True:
+            await asyncio.sleep(5)
+            elapsed += 5
             try:
-                # Check if sportif-item elements are present (the player cards)
-                items = await page.query_selector_all("sportif-item")
-                if len(items) > 0:
-                    logger.info(f"Player list detected with {len(items)} items on first page")
-                    print(f"Player list loaded! Found {len(items)} players on current page.")
-                    await asyncio.sleep(2)  # Let it fully render
-                    return
-
-                # Also check for the player list container
-                container = await page.query_selector(".ctr-list-sportifs")
-                if container:
-                    await asyncio.sleep(2)
-                    items = await page.query_selector_all("sportif-item")
-                    if len(items) > 0:
-                        logger.info(f"Player list detected with {len(items)} items")
-                        print(f"Player list loaded! Found {len(items)} players on current page.")
-                        return
+                button = page.locator(LOGIN_OVERLAY_SELECTOR).first
+                if await button.count():
+                    await button.click(timeout=2000)
+                    print("Dismissed overlay")
+                    await asyncio.sleep(1)
             except Exception:
                 # Page navigation (e.g. OAuth redirect) destroys the execution context.
                 # This is expected during login - just keep waiting.
                 pass
 
-            # Periodically try to dismiss overlays that reappear after login redirect
-            if i > 0 and i % 5 == 0:
-                try:
-                    for sel in ['button:has-text("Accept")', 'button:has-text("Accept All")', '#onetrust-accept-btn-handler']:
-                        elem = await page.query_selector(sel)
-                        if elem and await elem.is_visible():
-                            await elem.click()
-                            print(f"Dismissed overlay: {sel}")
-                            await asyncio.sleep(1)
-                            break
-                except Exception:
-                    pass
-
-            if i > 0 and i % 30 == 0:
-                print(f"Still waiting for login/player list... ({i}s elapsed)")
-
-        raise TimeoutError(
-            f"Timed out after {wait_seconds}s waiting for player list"
-        )
+            if elapsed % 30 == 0:
+                print(f"Still waiting for login/player list... ({elapsed}s elapsed)")
 
     async def _scrape_all_pages(self, page: Page) -> List[Dict[str, Any]]:
         """Scrape player data from all pages by clicking the next button."""
         all_players = []
+        seen_names = set()
+        pages_without_new = 0
         page_num = 1
-        previous_first_name = None
 
         while True:
-            # Scrape current page
+            # Scrape current page, keeping only players not seen on earlier pages
             page_players = await self._scrape_current_page(page)
-            all_players.extend(page_players)
+            new_count = 0
+            for player in page_players:
+                if player["name"] not in seen_names:
+                    seen_names.add(player["name"])
+                    all_players.append(player)
+                    new_count += 1
 
             current_first_name = page_players[0]["name"] if page_players else None
-            print(f"  Page {page_num}: scraped {len(page_players)} players (total: {len(all_players)})")
+            print(f"  Page {page_num}: scraped {new_count} new players (total: {len(all_players)})")
+
+            # Two full pages of repeats in a row: the paginator is cycling
+            if page_players and not new_count:
+                pages_without_new += 1
+                if pages_without_new == 2:
+                    print(f"No new players on two pages - reached end at page {page_num}.")
+                    break
+            else:
+                pages_without_new = 0
 
             # Try to go to next page
             has_next = await self._go_to_next_page(page)
@@ -407,21 +514,17 @@ class FantasySixNationsScraper(BaseScraper):
 
             page_num += 1
 
-            # Wait for the new page to render
-            await asyncio.sleep(1.5)
-
-            # Check if the page actually changed (same first player = stuck)
+            # Wait for the new page to render; if the first player never
+            # changes the paginator is stuck on the last page
             try:
-                new_items = await page.query_selector_all("sportif-item")
-                if new_items:
-                    name_elem = await new_items[0].query_selector(".nom-sportif")
-                    if name_elem:
-                        new_first_name = (await name_elem.inner_text()).strip()
-                        if new_first_name == current_first_name:
-                            print(f"Page content unchanged - reached end at page {page_num - 1}.")
-                            break
-            except Exception:
-                pass
+                await page.wait_for_function(
+                    FIRST_NAME_CHANGED_JS,
+                    arg=current_first_name,
+                    timeout=self.PAGE_CHANGE_TIMEOUT * 1000,
+                )
+            except PlaywrightTimeout:
+                print(f"Page content unchanged - reached end at page {page_num - 1}.")
+                break
 
             # Safety limit
             if page_num > 300:
@@ -432,85 +535,42 @@ class FantasySixNationsScraper(BaseScraper):
 
     async def _scrape_current_page(self, page: Page) -> List[Dict[str, Any]]:
         """Scrape all sportif-item elements on the current page."""
-        players = []
+        # One evaluate() for the whole page instead of ~10 round-trips per item
+        raw_items = await page.evaluate(EXTRACT_PLAYERS_JS)
 
-        items = await page.query_selector_all("sportif-item")
-        for item in items:
-            player = await self._extract_player(item)
+        players = []
+        for raw in raw_items:
+            player = self._extract_player(raw)
             if player:
                 players.append(player)
 
         return players
 
-    async def _extract_player(self, elem) -> Optional[Dict[str, Any]]:
-        """Extract player data from a sportif-item element."""
+    def _extract_player(self, raw: Dict[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+        """Build a player record from the fields EXTRACT_PLAYERS_JS read off one sportif-item."""
         try:
-            # Name: .nom-sportif
-            name = None
-            name_elem = await elem.query_selector(".nom-sportif")
-            if name_elem:
-                name = (await name_elem.inner_text()).strip()
-
+            name = raw.get("name")
             if not name:
                 return None
 
-            # Position: .position
-            position = None
-            pos_elem = await elem.query_selector(".position")
-            if pos_elem:
-                position = (await pos_elem.inner_text()).strip()
+            position = raw.get("position")
 
-            # Country: .info-match-club.club-sportif
-            country = None
-            country_elem = await elem.query_selector(".info-match-club.club-sportif")
-            if country_elem:
-                country = (await country_elem.inner_text()).strip()
-
-            # If country not found from text, try from image URL
+            # Country: .info-match-club.club-sportif, else from the image URL
+            country = raw.get("country")
             if not country:
-                img_elem = await elem.query_selector("img.image-sportif")
-                if img_elem:
-                    src = await img_elem.get_attribute("src") or ""
-                    for key, val in COUNTRY_FROM_IMAGE.items():
-                        if key in src.lower():
-                            country = val
-                            break
-
-            # Price: .valeur-sportif-nb
-            price = None
-            price_elem = await elem.query_selector(".valeur-sportif-nb")
-            if price_elem:
-                price_text = (await price_elem.inner_text()).strip()
-                try:
-                    price = float(price_text)
-                except ValueError:
-                    price_match = re.search(r'[\d.]+', price_text)
-                    if price_match:
-                        price = float(price_match.group())
-
-            # Ownership %: .sportif-data-value-pourcentage
-            ownership_pct = None
-            pct_elem = await elem.query_selector(".sportif-data-value-pourcentage")
-            if pct_elem:
-                pct_text = (await pct_elem.inner_text()).strip()
-                try:
-                    ownership_pct = float(pct_text)
-                except ValueError:
-                    pct_match = re.search(r'[\d.]+', pct_text)
-                    if pct_match:
-                        ownership_pct = float(pct_match.group())
-
-            # Opponent info
-            opponent = None
-            opp_elem = await elem.query_selector(".info-match-club.club-adversaire span")
-            if opp_elem:
-                opponent = (await opp_elem.inner_text()).strip()
+                match = _COUNTRY_IMAGE_RE.search(raw.get("img") or "")
+                if match:
+                    country = COUNTRY_FROM_IMAGE[match.group().lower()]
+
+            price = _parse_number(raw.get("price"))
+            ownership_pct = _parse_number(raw.get("pct"))
+
+            opponent = raw.get("opp")
 
             # Home/away: check for flight_takeoff (away) or home icon
             is_home = None
-            icon_elem = await elem.query_selector(".info-match-club.club-adversaire mat-icon")
-            if icon_elem:
-                icon_text = (await icon_elem.inner_text()).strip()
+            icon_text = raw.get("icon")
+            if icon_text is not None:
                 if "home" in icon_text:
                     is_home = True
                 elif "flight_takeoff" in icon_text:
@@ -520,16 +580,13 @@ class FantasySixNationsScraper(BaseScraper):
             # indicator div inside sportif-infos-forme.
             # X = T (Titulaire/starting), R (Remplaçant/sub), etc.
             availability = None
-            forme_elem = await elem.query_selector("sportif-infos-forme .forme")
-            if forme_elem:
-                forme_classes = (await forme_elem.get_attribute("class") or "").split()
-                for cls in forme_classes:
-                    if cls.startswith("forme-") and cls != "forme":
-                        suffix = cls.split("-", 1)[1]
-                        availability = FORME_CLASS_MAP.get(suffix)
-                        if availability is None:
-                            logger.warning(f"Unknown forme class suffix: {suffix!r}")
-                        break
+            for cls in (raw.get("forme") or "").split():
+                if cls.startswith("forme-") and cls != "forme":
+                    suffix = cls.split("-", 1)[1]
+                    availability = FORME_CLASS_MAP.get(suffix)
+                    if availability is None:
+                        logger.warning(f"Unknown forme class suffix: {suffix!r}")
+                    break
 
             return {
                 "name": name,
@@ -551,32 +608,19 @@ class FantasySixNationsScraper(BaseScraper):
         # The Fantasy Six Nations site uses Angular Material paginator.
         # Next button: class="mat-mdc-paginator-navigation-next", aria-label="Next"
         # Disabled state: class includes "mat-mdc-button-disabled-interactive"
-        btn = await page.query_selector('button.mat-mdc-paginator-navigation-next, button[aria-label="Next"]')
-        if not btn:
-            return False
-
-        # Check aria-disabled (set to "true" on last page)
-        aria_disabled = await btn.get_attribute("aria-disabled")
-        if aria_disabled == "true":
+        # (always present); the button state is read in one evaluate
+        if not await page.evaluate(NEXT_BUTTON_ENABLED_JS, NEXT_BUTTON_SELECTOR):
             return False
 
-        # Check for the specific disabled class (NOT "disabled-interactive" which is always present)
-        class_attr = await btn.get_attribute("class") or ""
-        # Split into individual classes and check for exact "mat-mdc-button-disabled"
-        classes = class_attr.split()
-        if "mat-mdc-button-disabled" in classes:
-            return False
-
-        # Check HTML disabled attribute
-        disabled = await btn.get_attribute("disabled")
-        if disabled is not None:
-            return False
-
-        await btn.click()
+        await page.locator(NEXT_BUTTON_SELECTOR).first.click()
         return True
 
     def parse(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Parse raw scraped data into structured player records."""
+        """Parse raw scraped data into structured player records.
+
+        ``_scrape_all_pages`` already drops repeats; the name check here
+        keeps parse() safe for raw data from any other source.
+        """
         players = []
         seen_names = set()
 
@@ -7,14 +7,17 @@ Handles three market types:
 3. Handicaps (overview) - Consensus spread from the Six Nations overview page
 """
 
-from typing import Dict, List, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 import logging
 import asyncio
-import json
+import gzip
+import os
 import re
 
+import orjson
 from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -26,6 +29,9 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "oddschecker"
 DEBUG_DIR = DATA_DIR / "debug"
 
+# Raw scrape archives are gzipped by default; set to "false" to write plain .json
+RAW_ARCHIVE_COMPRESS = os.getenv("RAW_ARCHIVE_COMPRESS", "true").lower() != "false"
+
 
 class OddscheckerScraper(BaseScraper):
     """Scraper for Oddschecker odds using Playwright browser automation."""
@@ -60,10 +66,12 @@ class OddscheckerScraper(BaseScraper):
         "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
     ]
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, browser: Optional[Browser] = None):
         self._browser: Optional[Browser] = None
         self._playwright = None
         self._headless = headless
+        # Long-lived browser owned by the caller (see app.scrapers.browser_pool)
+        self._shared_browser = browser
 
     async def _init_browser(self) -> Browser:
         """Initialize Playwright browser with stealth settings."""
@@ -122,6 +130,45 @@ class OddscheckerScraper(BaseScraper):
         page = await context.new_page()
         return page
 
+    @asynccontextmanager
+    async def _page_session(self) -> AsyncIterator[Page]:
+        """Yield a fresh page and clean up afterwards.
+
+        With a shared browser only the page's context is closed; otherwise a
+        browser is launched for this page and torn down with it.
+        """
+        if self._shared_browser is not None:
+            page = await self._create_page(self._shared_browser)
+            try:
+                yield page
+            finally:
+                await page.context.close()
+        else:
+            browser = await self._init_browser()
+            try:
+                yield await self._create_page(browser)
+            finally:
+                await self._close_browser()
+
+    @asynccontextmanager
+    async def browser_session(self) -> AsyncIterator[Browser]:
+        """Keep one browser open for every page opened inside the block.
+
+        Lets standalone scripts scrape several pages without relaunching
+        Chromium each time. A no-op when a shared browser was passed in.
+        """
+        if self._shared_browser is not None:
+            yield self._shared_browser
+            return
+
+        self._browser = await self._init_browser()
+        self._shared_browser = self._browser
+        try:
+            yield self._browser
+        finally:
+            self._shared_browser = None
+            await self._close_browser()
+
     async def _dismiss_cookie_consent(self, page: Page):
         """Try to dismiss cookie consent banners (including Admiral CMP used by Oddschecker)."""
         # Admiral CMP banner can take a few seconds to load, so retry a few times
@@ -167,6 +214,9 @@ class OddscheckerScraper(BaseScraper):
         """
         Save raw scrape results to a timestamped JSON file.
 
+        Written as ``.json.gz`` unless ``RAW_ARCHIVE_COMPRESS`` is off. This
+        does blocking file I/O, so async callers should run it in a thread.
+
         Args:
             data: The raw scrape result dict
             match_slug: Match identifier (e.g. "france-v-ireland")
@@ -177,9 +227,16 @@ class OddscheckerScraper(BaseScraper):
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         safe_slug = re.sub(r'[^\w\-]', '_', match_slug)
-        out_path = DATA_DIR / f"{safe_slug}_{ts}.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+        payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+
+        if RAW_ARCHIVE_COMPRESS:
+            out_path = DATA_DIR / f"{safe_slug}_{ts}.json.gz"
+            with gzip.open(out_path, "wb", compresslevel=4) as f:
+                f.write(payload)
+        else:
+            out_path = DATA_DIR / f"{safe_slug}_{ts}.json"
+            out_path.write_bytes(payload)
         logger.info(f"Raw JSON saved: {out_path}")
         return out_path
 
@@ -301,52 +358,48 @@ class OddscheckerScraper(BaseScraper):
         Returns:
             Dict with player odds data
         """
-        browser = await self._init_browser()
+        async with self._page_session() as page:
+            try:
+                logger.info(f"Navigating to {url}")
 
-        try:
-            page = await self._create_page(browser)
-            logger.info(f"Navigating to {url}")
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.DEFAULT_TIMEOUT)
 
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.DEFAULT_TIMEOUT)
+                # Dismiss cookie consent
+                await self._dismiss_cookie_consent(page)
 
-            # Dismiss cookie consent
-            await self._dismiss_cookie_consent(page)
+                # Wait for odds table to load
+                await self._wait_for_odds_table(page)
 
-            # Wait for odds table to load
-            await self._wait_for_odds_table(page)
+                # Additional wait for JavaScript content
+                await asyncio.sleep(self.PAGE_LOAD_WAIT)
 
-            # Additional wait for JavaScript content
-            await asyncio.sleep(self.PAGE_LOAD_WAIT)
+                # Extract bookmaker headers
+                bookmakers = await self._extract_bookmakers(page)
+                logger.info(f"Found {len(bookmakers)} bookmakers")
 
-            # Extract bookmaker headers
-            bookmakers = await self._extract_bookmakers(page)
-            logger.info(f"Found {len(bookmakers)} bookmakers")
+                # Extract player odds data
+                odds_data = await self._extract_player_odds(page, bookmakers)
+                logger.info(f"Extracted odds for {len(odds_data)} players")
 
-            # Extract player odds data
-            odds_data = await self._extract_player_odds(page, bookmakers)
-            logger.info(f"Extracted odds for {len(odds_data)} players")
-
-            return {
-                "market_type": "try_scorer",
-                "url": url,
-                "scraped_at": datetime.utcnow().isoformat(),
-                "bookmakers": bookmakers,
-                "odds_data": odds_data,
-            }
+                return {
+                    "market_type": "try_scorer",
+                    "url": url,
+                    "scraped_at": datetime.utcnow().isoformat(),
+                    "bookmakers": bookmakers,
+                    "odds_data": odds_data,
+                }
 
-        except PlaywrightTimeout as e:
-            logger.error(f"Timeout scraping {url}: {e}")
-            await self._save_debug_snapshot(page, "timeout_tryscorer")
-            raise
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {e}")
-            try:
-                await self._save_debug_snapshot(page, "error_tryscorer")
-            except Exception:
-                pass
-            raise
-        finally:
-            await self._close_browser()
+            except PlaywrightTimeout as e:
+                logger.error(f"Timeout scraping {url}: {e}")
+                await self._save_debug_snapshot(page, "timeout_tryscorer")
+                raise
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {e}")
+                try:
+                    await self._save_debug_snapshot(page, "error_tryscorer")
+                except Exception:
+                    pass
+                raise
 
     async def scrape_match_totals(self, url: str) -> Dict[str, Any]:
         """
@@ -358,52 +411,48 @@ class OddscheckerScraper(BaseScraper):
         Returns:
             Dict with over/under odds data
         """
-        browser = await self._init_browser()
-
-        try:
-            page = await self._create_page(browser)
-            logger.info(f"Navigating to {url}")
+        async with self._page_session() as page:
+            try:
+                logger.info(f"Navigating to {url}")
 
-            await page.goto(url, wait_until="domcontentloaded", timeout=self.DEFAULT_TIMEOUT)
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.DEFAULT_TIMEOUT)
 
-            # Dismiss cookie consent
-            await self._dismiss_cookie_consent(page)
+                # Dismiss cookie consent
+                await self._dismiss_cookie_consent(page)
 
-            # Wait for odds table to load
-            await self._wait_for_odds_table(page)
+                # Wait for odds table to load
+                await self._wait_for_odds_table(page)
 
-            # Additional wait for JavaScript content
-            await asyncio.sleep(self.PAGE_LOAD_WAIT)
+                # Additional wait for JavaScript content
+                await asyncio.sleep(self.PAGE_LOAD_WAIT)
 
-            # Extract bookmaker headers
-            bookmakers = await self._extract_bookmakers(page)
-            logger.info(f"Found {len(bookmakers)} bookmakers")
+                # Extract bookmaker headers
+                bookmakers = await self._extract_bookmakers(page)
+                logger.info(f"Found {len(bookmakers)} bookmakers")
 
-            # Extract over/under odds
-            totals_data = await self._extract_totals_odds(page, bookmakers)
-            logger.info(f"Extracted {len(totals_data)} totals lines")
+                # Extract over/under odds
+                totals_data = await self._extract_totals_odds(page, bookmakers)
+                logger.info(f"Extracted {len(totals_data)} totals lines")
 
-            return {
-                "market_type": "match_totals",
-                "url": url,
-                "scraped_at": datetime.utcnow().isoformat(),
-                "bookmakers": bookmakers,
-                "totals_data": totals_data,
-            }
+                return {
+                    "market_type": "match_totals",
+                    "url": url,
+                    "scraped_at": datetime.utcnow().isoformat(),
+                    "bookmakers": bookmakers,
+                    "totals_data": totals_data,
+                }
 
-        except PlaywrightTimeout as e:
-            logger.error(f"Timeout scraping {url}: {e}")
-            await self._save_debug_snapshot(page, "timeout_totals")
-            raise
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {e}")
-            try:
-                await self._save_debug_snapshot(page, "error_totals")
-            except Exception:
-                pass
-            raise
-        finally:
-            await self._close_browser()
+            except PlaywrightTimeout as e:
+                logger.error(f"Timeout scraping {url}: {e}")
+                await self._save_debug_snapshot(page, "timeout_totals")
+                raise
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {e}")
+                try:
+                    await self._save_debug_snapshot(page, "error_totals")
+                except Exception:
+                    pass
+                raise
 
     async def _wait_for_odds_table(self, page: Page):
         """Wait for odds table to appear on page."""
@@ -819,49 +868,45 @@ class OddscheckerScraper(BaseScraper):
                 "away_odds": 2.0,
             }
         """
-        browser = await self._init_browser()
-
-        try:
-            page = await self._create_page(browser)
-            logger.info(f"Navigating to overview: {self.SIX_NATIONS_URL}")
+        async with self._page_session() as page:
+            try:
+                logger.info(f"Navigating to overview: {self.SIX_NATIONS_URL}")
 
-            await page.goto(
-                self.SIX_NATIONS_URL,
-                wait_until="domcontentloaded",
-                timeout=self.DEFAULT_TIMEOUT,
-            )
-            await asyncio.sleep(self.PAGE_LOAD_WAIT)
-            await self._dismiss_cookie_consent(page)
+                await page.goto(
+                    self.SIX_NATIONS_URL,
+                    wait_until="domcontentloaded",
+                    timeout=self.DEFAULT_TIMEOUT,
+                )
+                await asyncio.sleep(self.PAGE_LOAD_WAIT)
+                await self._dismiss_cookie_consent(page)
 
-            # Click "Change Market" and select "Handicaps"
-            await self._select_overview_market(page, "Handicaps")
-            await asyncio.sleep(self.PAGE_LOAD_WAIT)
+                # Click "Change Market" and select "Handicaps"
+                await self._select_overview_market(page, "Handicaps")
+                await asyncio.sleep(self.PAGE_LOAD_WAIT)
 
-            # Extract match cards
-            matches = await self._extract_overview_handicaps(page)
-            logger.info(f"Extracted handicap lines for {len(matches)} matches")
+                # Extract match cards
+                matches = await self._extract_overview_handicaps(page)
+                logger.info(f"Extracted handicap lines for {len(matches)} matches")
 
-            if not matches:
-                await self._save_debug_snapshot(page, "no_handicaps_overview")
+                if not matches:
+                    await self._save_debug_snapshot(page, "no_handicaps_overview")
 
-            return matches
+                return matches
 
-        except PlaywrightTimeout as e:
-            logger.error(f"Timeout scraping overview handicaps: {e}")
-            try:
-                await self._save_debug_snapshot(page, "timeout_handicaps_overview")
-            except Exception:
-                pass
-            raise
-        except Exception as e:
-            logger.error(f"Error scraping overview handicaps: {e}")
-            try:
-                await self._save_debug_snapshot(page, "error_handicaps_overview")
-            except Exception:
-                pass
-            raise
-        finally:
-            await self._close_browser()
+            except PlaywrightTimeout as e:
+                logger.error(f"Timeout scraping overview handicaps: {e}")
+                try:
+                    await self._save_debug_snapshot(page, "timeout_handicaps_overview")
+                except Exception:
+                    pass
+                raise
+            except Exception as e:
+                logger.error(f"Error scraping overview handicaps: {e}")
+                try:
+                    await self._save_debug_snapshot(page, "error_handicaps_overview")
+                except Exception:
+                    pass
+                raise
 
     async def _select_overview_market(self, page: Page, market_name: str):
         """Click the market-switcher dropdown on the overview page and select a market.
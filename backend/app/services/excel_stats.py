@@ -1,12 +1,25 @@
 """
 Service for reading player stats from the Excel file.
+
+The parsed workbook is cached per (path, mtime), together with per-country
+and per-position indexes, so it is only re-read when the file changes.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
 
 import pandas as pd
 
 
+class ExcelStats(NamedTuple):
+    """A parsed workbook plus the lookups the stats endpoints filter on."""
+    players: List[dict]
+    by_country: Dict[str, List[dict]]
+    by_position: Dict[str, List[dict]]
+    positions: Tuple[str, ...]  # sorted, without blanks
+
+
 class ExcelStatsService:
     """Service to read and process player stats from Excel file."""
 
@@ -59,23 +72,32 @@ class ExcelStatsService:
             file_path = backend_dir / "data" / "M6N 2025 Fantasy Stats.xlsx"
         self.file_path = Path(file_path)
 
+    def load(self) -> ExcelStats:
+        """Parsed workbook and its indexes (cached until the file changes)."""
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Excel file not found: {self.file_path}")
+        return self._load(self.file_path, os.stat(self.file_path).st_mtime_ns)
+
     def get_all_players(self) -> list[dict]:
         """
-        Read all country sheets from Excel and combine into single list.
+        All players from every country sheet, combined into a single list.
         Each player dict includes their country.
         """
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"Excel file not found: {self.file_path}")
+        return self.load().players
 
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _load(cls, file_path: Path, mtime_ns: int) -> ExcelStats:
+        # mtime_ns is only part of the cache key: a rewritten file is a new entry
         all_players = []
 
-        for country in self.COUNTRIES:
+        for country in cls.COUNTRIES:
             try:
-                df = pd.read_excel(self.file_path, sheet_name=country)
+                df = pd.read_excel(file_path, sheet_name=country)
                 df["Country"] = country
 
                 # Rename columns to API format
-                df = df.rename(columns=self.COLUMN_MAP)
+                df = df.rename(columns=cls.COLUMN_MAP)
 
                 # Remove duplicate columns (some sheets have both WK 1 and WK1)
                 df = df.loc[:, ~df.columns.duplicated()]
@@ -95,14 +117,23 @@ class ExcelStatsService:
                 print(f"Error reading {country} sheet: {e}")
                 continue
 
-        return all_players
+        by_country: Dict[str, List[dict]] = {}
+        by_position: Dict[str, List[dict]] = {}
+        for player in all_players:
+            by_country.setdefault(player.get("country"), []).append(player)
+            by_position.setdefault(player.get("position"), []).append(player)
+        positions = tuple(sorted(p for p in by_position if p))
+
+        return ExcelStats(all_players, by_country, by_position, positions)
 
     def get_players_by_country(self, country: str) -> list[dict]:
         """Get players for a specific country."""
-        all_players = self.get_all_players()
-        return [p for p in all_players if p.get("country") == country]
+        return self.load().by_country.get(country, [])
 
     def get_players_by_position(self, position: str) -> list[dict]:
         """Get players for a specific position."""
-        all_players = self.get_all_players()
-        return [p for p in all_players if p.get("position") == position]
+        return self.load().by_position.get(position, [])
+
+    def get_positions(self) -> Tuple[str, ...]:
+        """Unique positions across all sheets, sorted."""
+        return self.load().positions
@@ -0,0 +1,30 @@
+"""
+Shared outbound HTTP client.
+
+Google token checks and GitHub issue creation used to open a fresh
+``httpx.AsyncClient`` per request, paying a TCP + TLS handshake every time.
+One pooled client is created lazily and reused for the life of the process;
+``shutdown()`` is called from the app lifespan.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def shutdown():
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
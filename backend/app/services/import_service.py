@@ -3,12 +3,13 @@ Service for importing scraped fantasy player JSON into the database.
 Uses fuzzy matching to link scraped names to existing Player records.
 """
 
-import json
+import asyncio
 import logging
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from rapidfuzz import fuzz, process
@@ -125,30 +126,40 @@ def _fuzzy_find(name: str, cache: Dict[str, Player]) -> Optional[Player]:
     return None
 
 
+def _load_json(path: Path) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 async def import_scraped_json(
     db: AsyncSession, file_path: str
 ) -> Dict[str, Any]:
     """
-    Import scraped fantasy player JSON into Player + FantasyPrice tables.
-
-    For each player in the JSON:
-    - Try to find an existing Player by fuzzy name match
-    - If not found, create a new Player record
-    - Create or update FantasyPrice for the given season/round
+    Import a scraped fantasy player JSON file into Player + FantasyPrice tables.
 
-    Returns summary dict with counts and errors.
+    Returns summary dict with counts and errors (see ``import_players``).
     """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"JSON file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = await asyncio.to_thread(_load_json, path)
+    return await import_players(db, data["season"], data["round"], data["players"])
+
 
-    season = data["season"]
-    round_num = data["round"]
-    players_data: List[Dict[str, Any]] = data["players"]
+async def import_players(
+    db: AsyncSession, season: int, round_num: int, players_data: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Import parsed fantasy players into Player + FantasyPrice tables.
+
+    For each player:
+    - Try to find an existing Player by fuzzy name match
+    - If not found, create a new Player record
+    - Create or update FantasyPrice for the given season/round
 
+    Returns summary dict with counts and errors.
+    """
     cache = await _build_player_cache(db)
 
     created = 0
@@ -0,0 +1,99 @@
+"""
+Buffered writer for ScrapeRun history rows.
+
+Scrape jobs record one row per market per match. Rather than opening a
+session and committing for every row, rows are queued and a single
+background task inserts them in batches (up to ``max_batch`` rows, or
+whatever arrived within ``timeout`` seconds of the first one).
+Callbacks registered with ``on_flush`` run after each batch is committed,
+for caches that must not be refreshed before the rows exist.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import logging
+
+from app.database import async_session
+from app.models.scrape_run import ScrapeRun
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeRunBatcher:
+    """Queue ScrapeRun rows and insert them in batches from one background task."""
+
+    def __init__(self, max_batch: int = 64, timeout: float = 1.0, maxsize: int = 1000):
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self._flush_callbacks: List[Callable[[], None]] = []
+
+    def on_flush(self, callback: Callable[[], None]):
+        """Call ``callback`` after every committed batch."""
+        self._flush_callbacks.append(callback)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the flush loop (called from the app lifespan)."""
+        if not self.running:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Flush everything still queued and stop the flush loop."""
+        if not self.running:
+            return
+        await self.queue.put(None)
+        await self._task
+        self._task = None
+
+    async def put(self, row: Dict[str, Any]):
+        """Queue a row; written immediately if the flush loop isn't running."""
+        if self.running:
+            await self.queue.put(row)
+        else:
+            await self._flush([row])
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self.queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + self.timeout
+            stopping = False
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        try:
+            async with async_session() as db:
+                db.add_all([ScrapeRun(**row) for row in batch])
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to record {len(batch)} scrape run(s): {e}", exc_info=True)
+            return
+        for callback in self._flush_callbacks:
+            callback()
+
+
+batcher = ScrapeRunBatcher()
@@ -0,0 +1,3 @@
+from app.utils.time import utcnow, utcnow_naive
+
+__all__ = ["utcnow", "utcnow_naive"]
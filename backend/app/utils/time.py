@@ -0,0 +1,19 @@
+"""
+UTC timestamp helpers, used as model column defaults.
+
+Columns declared ``DateTime(timezone=True)`` take ``utcnow``; plain
+``DateTime`` columns (timestamp without time zone) take ``utcnow_naive`` —
+asyncpg rejects aware datetimes for those.
+"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def utcnow_naive() -> datetime:
+    """Current UTC time without tzinfo (replaces the deprecated ``datetime.utcnow``)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,6 @@
+-- Migration: Indexes for the per-round odds lookups
+-- Try scorer odds counted per country for a (season, round) when detecting missing markets
+-- (match_odds is already covered by uq_match_odds_season_round_teams)
+
+CREATE INDEX IF NOT EXISTS ix_odds_try_scorer_season_round ON odds (season, round, player_id) WHERE anytime_try_scorer IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_players_country ON players (country);
@@ -0,0 +1,5 @@
+-- Migration: Indexes for keyset pagination of the historical stats endpoints
+-- Pages are ordered by (match_date DESC, id DESC) and resume after the previous page's last row
+
+CREATE INDEX IF NOT EXISTS ix_six_nations_stats_match_date_id ON six_nations_stats (match_date, id);
+CREATE INDEX IF NOT EXISTS ix_club_stats_match_date_id ON club_stats (match_date, id);
@@ -0,0 +1,10 @@
+-- Migration: (season, round) indexes for per-round listings
+-- These tables' unique constraints lead with player_id, so per-round scans couldn't use them
+-- (match_odds is already covered by uq_match_odds_season_round_teams)
+
+CREATE INDEX IF NOT EXISTS ix_odds_season_round ON odds (season, round);
+CREATE INDEX IF NOT EXISTS ix_fantasy_prices_season_round ON fantasy_prices (season, round);
+CREATE INDEX IF NOT EXISTS ix_team_selections_season_round ON team_selections (season, round);
+CREATE INDEX IF NOT EXISTS ix_predictions_season_round ON predictions (season, round);
+CREATE INDEX IF NOT EXISTS ix_six_nations_stats_season_round ON six_nations_stats (season, round);
+CREATE INDEX IF NOT EXISTS ix_fantasy_round_stats_season_round ON fantasy_round_stats (season, round);
@@ -0,0 +1,12 @@
+-- Migration: one prediction per player per round
+-- /api/predictions/generate used to insert a fresh row on every run; keep the newest
+
+DELETE FROM predictions p
+USING predictions newer
+WHERE newer.player_id = p.player_id
+  AND newer.season = p.season
+  AND newer.round = p.round
+  AND newer.id > p.id;
+
+ALTER TABLE predictions
+    ADD CONSTRAINT uq_prediction_player_season_round UNIQUE (player_id, season, round);
@@ -0,0 +1,11 @@
+CREATE TABLE IF NOT EXISTS scrape_jobs (
+    id VARCHAR(36) PRIMARY KEY,
+    dedup_key TEXT,
+    status VARCHAR(20) NOT NULL DEFAULT 'in_progress',
+    state JSON NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS ix_scrape_jobs_dedup_key ON scrape_jobs (dedup_key);
+CREATE INDEX IF NOT EXISTS ix_scrape_jobs_expires_at ON scrape_jobs (expires_at);
@@ -268,28 +268,55 @@ async def get_pagination_info(page: Page) -> str:
     return (await label.inner_text()).strip() if label else ""
 
 
-async def scrape_all_pages(page: Page) -> list:
-    """Scrape all pages for the currently selected round."""
-    all_players = []
+async def wait_for_page_change(page: Page, previous: str, timeout: int = 5000):
+    """Wait until the paginator range label moves on from ``previous``.
+
+    The table re-renders in the same change-detection pass as the label,
+    so this returns as soon as the next page is in the DOM.
+    """
+    try:
+        await page.wait_for_function(
+            """prev => {
+                const el = document.querySelector('.mat-mdc-paginator-range-label');
+                return el && el.innerText.trim() !== prev;
+            }""",
+            arg=previous,
+            timeout=timeout,
+        )
+    except Exception:
+        # Label never changed (or isn't there) — fall back to a fixed wait
+        await asyncio.sleep(1)
+
+
+async def scrape_pages(page: Page):
+    """Yield the player rows of each page for the currently selected round."""
+    total = 0
     page_num = 1
 
     while True:
         page_players = await scrape_current_page(page)
-        all_players.extend(page_players)
+        total += len(page_players)
 
         pagination = await get_pagination_info(page)
-        print(f"  Page {page_num}: {len(page_players)} players (total: {len(all_players)}) [{pagination}]")
+        print(f"  Page {page_num}: {len(page_players)} players (total: {total}) [{pagination}]")
+        yield page_players
 
         has_next = await go_to_next_page(page)
         if not has_next:
             break
 
         page_num += 1
-        await asyncio.sleep(1)
+        await wait_for_page_change(page, pagination)
 
         if page_num > 100:
             break
 
+
+async def scrape_all_pages(page: Page) -> list:
+    """Scrape all pages for the currently selected round."""
+    all_players = []
+    async for page_players in scrape_pages(page):
+        all_players.extend(page_players)
     return all_players
 
 
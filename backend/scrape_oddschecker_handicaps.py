@@ -5,8 +5,8 @@ Uses the Six Nations overview page with the Handicaps market selected,
 which shows a single consensus line per match. Much simpler and more
 accurate than the old per-match approach that interpolated across 30+ lines.
 
-Saves raw JSON to backend/data/oddschecker/ and optionally persists
-odds to the database.
+Saves raw JSON (gzipped as .json.gz unless RAW_ARCHIVE_COMPRESS is off) to
+backend/data/oddschecker/ and optionally persists odds to the database.
 
 Usage:
     python scrape_oddschecker_handicaps.py                         # headless, all matches
@@ -2,8 +2,8 @@
 Standalone script to scrape total points (over/under) odds from Oddschecker.
 
 Auto-discovers Six Nations match URLs and scrapes per-bookmaker over/under odds.
-Saves raw JSON to backend/data/oddschecker/ and optionally persists averaged
-odds to the database.
+Saves raw JSON (gzipped as .json.gz unless RAW_ARCHIVE_COMPRESS is off) to
+backend/data/oddschecker/ and optionally persists averaged odds to the database.
 
 Usage:
     python scrape_oddschecker_totals.py                         # headless, all matches
@@ -109,90 +109,88 @@ async def main():
         print(f"Single match: {args.match}")
     print()
 
-    # -------------------------------------------------------------------
-    # Determine which matches to scrape
-    # -------------------------------------------------------------------
-    if args.match:
-        slug = args.match
-        base_url = f"https://www.oddschecker.com/rugby-union/six-nations/{slug}/total-points"
-        matches_to_scrape = [{
-            "slug": slug,
-            "home": slug.split("-v-")[0].replace("-", " ").title() if "-v-" in slug else slug,
-            "away": slug.split("-v-")[1].replace("-", " ").title() if "-v-" in slug else "",
-            "url": base_url,
-        }]
-    else:
-        print("Discovering Six Nations matches on Oddschecker...")
-        browser = await scraper._init_browser()
-        try:
-            page = await scraper._create_page(browser)
-            matches_to_scrape = await scraper.discover_six_nations_matches(page)
-        finally:
-            await scraper._close_browser()
-
-        if not matches_to_scrape:
-            print("No Six Nations matches found on Oddschecker. Check debug/ for snapshots.")
-            return
-
-        # Append /total-points to each discovered URL
-        for m in matches_to_scrape:
-            base = m["url"].rstrip("/")
-            if "/winner" in base or "/anytime" in base or "/total" in base:
-                base = base.rsplit("/", 1)[0]
-            m["url"] = f"{base}/total-points"
-
-        print(f"Found {len(matches_to_scrape)} matches:")
-        for m in matches_to_scrape:
-            print(f"  {m['home']} v {m['away']}  ({m['slug']})")
-        print()
-
-    # -------------------------------------------------------------------
-    # Scrape each match
-    # -------------------------------------------------------------------
-    all_results = []
-
-    for match in matches_to_scrape:
-        slug = match["slug"]
-        url = match["url"]
-        print(f"\n{'=' * 60}")
-        print(f"  {match['home']} v {match['away']}")
-        print(f"  {url}")
-        print(f"{'=' * 60}")
-
-        try:
-            raw_data, parsed_data = await scrape_match(scraper, url, slug)
-            print_summary_table(parsed_data)
-            all_results.append({
-                "match": match,
-                "parsed": parsed_data,
-                "line_count": len(parsed_data),
-                "bookmaker_count": len(raw_data.get("bookmakers", [])),
-            })
-
-            # Optionally save to DB
-            if args.save_db:
-                try:
-                    db_result = await save_to_db(
-                        parsed_data,
-                        season=args.season,
-                        round_num=args.round,
-                        match_date=date.today(),
-                        home_team=match["home"],
-                        away_team=match["away"],
-                    )
-                    print(
-                        f"\n  DB: saved={db_result.get('saved')}, "
-                        f"updated={db_result.get('updated')}, "
-                        f"line={db_result.get('line')}"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to save to DB: {e}", exc_info=True)
-                    print(f"\n  DB save failed: {e}")
-
-        except Exception as e:
-            logger.error(f"Failed to scrape {slug}: {e}", exc_info=True)
-            print(f"\n  FAILED: {e}")
-            print("  Check data/oddschecker/debug/ for screenshots and HTML dumps.")
+    # One browser for discovery and every match page
+    async with scraper.browser_session():
+        # -------------------------------------------------------------------
+        # Determine which matches to scrape
+        # -------------------------------------------------------------------
+        if args.match:
+            slug = args.match
+            base_url = f"https://www.oddschecker.com/rugby-union/six-nations/{slug}/total-points"
+            matches_to_scrape = [{
+                "slug": slug,
+                "home": slug.split("-v-")[0].replace("-", " ").title() if "-v-" in slug else slug,
+                "away": slug.split("-v-")[1].replace("-", " ").title() if "-v-" in slug else "",
+                "url": base_url,
+            }]
+        else:
+            print("Discovering Six Nations matches on Oddschecker...")
+            async with scraper._page_session() as page:
+                matches_to_scrape = await scraper.discover_six_nations_matches(page)
+
+            if not matches_to_scrape:
+                print("No Six Nations matches found on Oddschecker. Check debug/ for snapshots.")
+                return
+
+            # Append /total-points to each discovered URL
+            for m in matches_to_scrape:
+                base = m["url"].rstrip("/")
+                if "/winner" in base or "/anytime" in base or "/total" in base:
+                    base = base.rsplit("/", 1)[0]
+                m["url"] = f"{base}/total-points"
+
+            print(f"Found {len(matches_to_scrape)} matches:")
+            for m in matches_to_scrape:
+                print(f"  {m['home']} v {m['away']}  ({m['slug']})")
+            print()
+
+        # -------------------------------------------------------------------
+        # Scrape each match
+        # -------------------------------------------------------------------
+        all_results = []
+
+        for match in matches_to_scrape:
+            slug = match["slug"]
+            url = match["url"]
+            print(f"\n{'=' * 60}")
+            print(f"  {match['home']} v {match['away']}")
+            print(f"  {url}")
+            print(f"{'=' * 60}")
+
+            try:
+                raw_data, parsed_data = await scrape_match(scraper, url, slug)
+                print_summary_table(parsed_data)
+                all_results.append({
+                    "match": match,
+                    "parsed": parsed_data,
+                    "line_count": len(parsed_data),
+                    "bookmaker_count": len(raw_data.get("bookmakers", [])),
+                })
+
+                # Optionally save to DB
+                if args.save_db:
+                    try:
+                        db_result = await save_to_db(
+                            parsed_data,
+                            season=args.season,
+                            round_num=args.round,
+                            match_date=date.today(),
+                            home_team=match["home"],
+                            away_team=match["away"],
+                        )
+                        print(
+                            f"\n  DB: saved={db_result.get('saved')}, "
+                            f"updated={db_result.get('updated')}, "
+                            f"line={db_result.get('line')}"
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to save to DB: {e}", exc_info=True)
+                        print(f"\n  DB save failed: {e}")
+
+            except Exception as e:
+                logger.error(f"Failed to scrape {slug}: {e}", exc_info=True)
+                print(f"\n  FAILED: {e}")
+                print("  Check data/oddschecker/debug/ for screenshots and HTML dumps.")
 
     # -------------------------------------------------------------------
     # Final summary
@@ -72,3 +72,216 @@ async def test_predictions_endpoint(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
+
+
+@pytest.mark.asyncio
+async def test_token_cache_skips_decode(client: AsyncClient, monkeypatch):
+    from app import auth
+
+    auth._token_cache.clear()
+    response = await client.post(
+        "/api/auth/register",
+        json={"email": "cache@example.com", "name": "Cache", "password": "hunter2hunter2"},
+    )
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    first = await client.get("/api/auth/me", headers=headers)
+    assert first.status_code == 200
+
+    def fail_decode(token):
+        raise AssertionError("token should come from the cache")
+
+    monkeypatch.setattr(auth, "decode_token", fail_decode)
+    second = await client.get("/api/auth/me", headers=headers)
+    assert second.status_code == 200
+    assert second.json()["email"] == "cache@example.com"
+    auth._token_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_login_accepts_legacy_bcrypt_hash(client: AsyncClient, db_session):
+    import bcrypt
+    from app.models.user import User
+
+    hashed = bcrypt.hashpw(b"hunter2hunter2", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    db_session.add(User(email="legacy@example.com", name="Legacy", hashed_password=hashed))
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/auth/login", json={"email": "legacy@example.com", "password": "hunter2hunter2"},
+    )
+    assert response.status_code == 200
+    bad = await client.post(
+        "/api/auth/login", json={"email": "legacy@example.com", "password": "wrong-password"},
+    )
+    assert bad.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_historical_stats_keyset_pages(client: AsyncClient, db_session, monkeypatch):
+    from datetime import date
+    from app.api import streaming
+    from app.models import Player
+    from app.models.stats import SixNationsStats
+    from tests.conftest import TestingSessionLocal
+
+    monkeypatch.setattr(streaming, "async_session", TestingSessionLocal)
+    player = Player(name="Paged", country="Ireland", fantasy_position="prop")
+    db_session.add(player)
+    await db_session.flush()
+    for i in range(5):
+        db_session.add(SixNationsStats(
+            player_id=player.id, season=2025, round=1, match_date=date(2025, 2, 1 + i % 2),
+            opponent="France", home_away="home", started=True,
+        ))
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/stats/historical/six-nations", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend((row["match_date"], row["id"]) for row in page["data"])
+        cursor = page["next_cursor"]
+    assert cursor is None
+    assert seen == sorted(seen, reverse=True) and len(set(seen)) == 5
+
+    bad = await client.get("/api/stats/historical/six-nations", params={"cursor": "nope"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_generate_predictions_twice_keeps_one_per_player(client: AsyncClient, db_session):
+    from sqlalchemy import func, select
+    from app.auth import require_admin
+    from app.main import app
+    from app.models import Player, Prediction
+    from app.models.prediction import TeamSelection
+
+    app.dependency_overrides[require_admin] = lambda: None
+    player = Player(name="Regen", country="Wales", fantasy_position="centre")
+    db_session.add(player)
+    await db_session.flush()
+    db_session.add(TeamSelection(player_id=player.id, season=2025, round=1, is_starting=True))
+    await db_session.commit()
+
+    for _ in range(2):
+        response = await client.post("/api/predictions/generate", params={"round": 1, "season": 2025})
+        assert response.status_code == 200
+        assert response.json()["predictions_generated"] == 1
+
+    count = await db_session.scalar(select(func.count()).select_from(Prediction))
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_round_status_cached_until_invalidated(client: AsyncClient, db_session):
+    from app.api import matches
+    from app.models import FantasyPrice, Player
+
+    matches.invalidate_round_status_cache()
+    params = {"season": 2026, "game_round": 1}
+    first = await client.get("/api/matches/status", params=params)
+    assert first.status_code == 200
+    assert first.json()["price_count"] == 0
+
+    player = Player(name="Cached", country="France", fantasy_position="prop")
+    db_session.add(player)
+    await db_session.flush()
+    db_session.add(FantasyPrice(player_id=player.id, season=2026, round=1, price=10))
+    await db_session.commit()
+
+    cached = await client.get("/api/matches/status", params=params)
+    assert cached.content == first.content
+
+    matches.invalidate_round_status_cache()
+    fresh = await client.get("/api/matches/status", params=params)
+    assert fresh.json()["price_count"] == 1
+    matches.invalidate_round_status_cache()
+
+
+@pytest.mark.asyncio
+async def test_value_analysis_aggregates_roster_stats(client: AsyncClient, db_session):
+    from datetime import date
+    from app.models import ClubStats, FantasyPrice, Player, SixNationsStats
+
+    priced = Player(name="Priced", country="France", fantasy_position="centre")
+    unpriced = Player(name="Unpriced", country="Wales", fantasy_position="wing")
+    db_session.add_all([priced, unpriced])
+    await db_session.flush()
+    db_session.add_all([
+        FantasyPrice(player_id=priced.id, season=2026, round=1, price=10),
+        SixNationsStats(
+            player_id=priced.id, season=2025, round=1, match_date=date(2025, 2, 1),
+            opponent="Wales", home_away="home", started=True, tries=1, fantasy_points=20,
+        ),
+        ClubStats(
+            player_id=priced.id, league="top_14", season="2024-25", match_date=date(2025, 3, 1),
+            opponent="Racing", home_away="away", started=True, tries=2, tackles_made=6,
+        ),
+        ClubStats(
+            player_id=unpriced.id, league="urc", season="2024-25", match_date=date(2025, 3, 1),
+            opponent="Ospreys", home_away="home", started=True, tries=3,
+        ),
+    ])
+    await db_session.commit()
+
+    response = await client.get("/api/players/value-analysis", params={"season": 2026})
+    assert response.status_code == 200
+    [row] = response.json()
+    assert row["name"] == "Priced"
+    assert row["total_games"] == 2
+    assert row["avg_tries_per_game"] == 1.5
+    assert row["avg_tackles_per_game"] == 3.0
+    assert row["avg_fantasy_points"] == 20.0
+
+    response = await client.get(
+        "/api/players/value-analysis", params={"season": 2026, "country": "Wales"},
+    )
+    assert response.json() == []
+
+
+def test_round_status_cache_is_bounded(monkeypatch):
+    from app.api import matches
+
+    monkeypatch.setattr(matches, "_round_status_cache", {})
+    for game_round in range(matches.ROUND_STATUS_CACHE_MAX + 10):
+        matches._cache_round_status((2026, game_round), b"{}", now=0.0)
+    assert len(matches._round_status_cache) == matches.ROUND_STATUS_CACHE_MAX
+    assert (2026, 0) not in matches._round_status_cache
+
+    # Expired entries are dropped on the next insert
+    matches._cache_round_status((2027, 1), b"{}", now=matches.ROUND_STATUS_CACHE_TTL + 1)
+    assert list(matches._round_status_cache) == [(2027, 1)]
+
+
+@pytest.mark.asyncio
+async def test_round_status_cache_cleared_after_run_row_committed(monkeypatch):
+    from app.api import matches
+    from app.services import scrape_run_batcher
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def add_all(self, rows):
+            pass
+
+        async def commit(self):
+            # A /status poll landing before the row is committed
+            matches._cache_round_status((2026, 1), b"stale", now=0.0)
+
+    monkeypatch.setattr(scrape_run_batcher, "async_session", _Session)
+    batcher = scrape_run_batcher.ScrapeRunBatcher()
+    batcher.on_flush(matches.invalidate_round_status_cache)
+
+    await batcher.put({"season": 2026, "round": 1, "market_type": "handicaps", "status": "completed"})
+    assert matches._round_status_cache == {}
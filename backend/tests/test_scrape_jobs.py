@@ -0,0 +1,208 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.api import job_store, scrape
+
+
+async def _complete(job_id: str, release: asyncio.Event):
+    await release.wait()
+    job = job_store.active_jobs[job_id]
+    job["status"] = "completed"
+    job["message"] = "Done"
+
+
+@pytest.mark.asyncio
+async def test_finished_job_moves_to_recent(client: AsyncClient):
+    release = asyncio.Event()
+    job_id = job_store.create_job("test")
+    job_store.start_job(job_id, _complete(job_id, release))
+
+    response = await client.get("/api/scrape/active")
+    assert [j["job_id"] for j in response.json()["active"]] == [job_id]
+
+    release.set()
+    await job_store.tasks[job_id]
+    await asyncio.sleep(0)  # let the done-callback run
+
+    data = (await client.get("/api/scrape/active")).json()
+    assert data["active"] == []
+    assert data["latest_finished"]["job_id"] == job_id
+
+    status = (await client.get(f"/api/scrape/status/{job_id}")).json()
+    assert status["status"] == "completed"
+
+
+def test_recent_jobs_are_bounded(monkeypatch):
+    monkeypatch.setattr(job_store, "RECENT_JOBS_MAX", 3)
+    monkeypatch.setattr(job_store, "recent_jobs", job_store.OrderedDict())
+    job_ids = [job_store.create_job("test") for _ in range(5)]
+    for job_id in job_ids:
+        job_store.finish_job(job_id)
+
+    assert list(job_store.recent_jobs) == job_ids[-3:]
+
+
+@pytest.mark.asyncio
+async def test_missing_markets_detected_per_match(db_session, monkeypatch):
+    from datetime import date
+    from decimal import Decimal
+
+    from app.models.odds import MatchOdds, Odds
+    from app.models.player import Player
+    from app.schemas.odds import AllMatchOddsScrapeRequest
+
+    ireland = Player(name="A", country="Ireland", fantasy_position="back_three")
+    france = Player(name="B", country="France", fantasy_position="back_three")
+    db_session.add_all([ireland, france])
+    await db_session.flush()
+    db_session.add_all([
+        MatchOdds(season=2026, round=1, match_date=date(2026, 2, 5),
+                  home_team="Ireland", away_team="Wales",
+                  handicap_line=Decimal("-10.5"), over_under_line=Decimal("45.5")),
+        MatchOdds(season=2026, round=1, match_date=date(2026, 2, 5),
+                  home_team="France", away_team="Italy", handicap_line=Decimal("-20.5")),
+        Odds(player_id=ireland.id, season=2026, round=1, match_date=date(2026, 2, 5),
+             anytime_try_scorer=Decimal("2.5")),
+        Odds(player_id=france.id, season=2026, round=1, match_date=date(2026, 2, 5)),
+    ])
+    await db_session.commit()
+
+    captured = {}
+
+    async def _fake_run_scraper(*args, per_match_missing=None, **kwargs):
+        captured.update(per_match_missing)
+
+    monkeypatch.setattr(scrape, "_run_scraper", _fake_run_scraper)
+    await scrape.scrape_missing_markets(
+        AllMatchOddsScrapeRequest(season=2026, round=1), db=db_session, _admin=None,
+    )
+    await asyncio.sleep(0)
+
+    assert captured == {
+        ("France", "Italy"): [
+            (scrape.MARKET_URL_MAP["totals"], scrape.MARKET_TYPE_MAP["totals"]),
+            (scrape.MARKET_URL_MAP["try_scorer"], scrape.MARKET_TYPE_MAP["try_scorer"]),
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_recent_market_scrape_is_reused(monkeypatch):
+    from datetime import date
+
+    class _Scraper:
+        calls = 0
+
+        async def scrape(self, url, market_type):
+            self.calls += 1
+            return {}
+
+        def parse(self, raw):
+            return []
+
+        def save_raw_json(self, data, slug):
+            pass
+
+    async def _save(service, *args):
+        return {"saved": True}
+
+    async def _record(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(scrape, "_recent_scrapes", {})
+    monkeypatch.setitem(scrape._SAVE_FN, "try_scorer", _save)
+    monkeypatch.setattr(scrape, "_record_scrape_run", _record)
+
+    scraper = _Scraper()
+    match = {"slug": "a-v-b", "home": "A", "away": "B", "base_url": "https://x/a-v-b"}
+    args = (scraper, match, "anytime-tryscorer", "try_scorer", 2026, 1, date(2026, 2, 5))
+
+    assert await scrape._scrape_market_for_match(*args) == {"saved": True}
+    assert await scrape._scrape_market_for_match(*args) == {"cached": True}
+    assert scraper.calls == 1
+
+    assert await scrape._scrape_market_for_match(*args, force_refresh=True) == {"saved": True}
+    assert scraper.calls == 2
+
+    # Another round is a different cache entry
+    other_round = (scraper, match, "anytime-tryscorer", "try_scorer", 2026, 2, date(2026, 2, 14))
+    assert await scrape._scrape_market_for_match(*other_round) == {"saved": True}
+    assert scraper.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_job_status_survives_restart(client: AsyncClient, db_session, monkeypatch):
+    from tests.conftest import TestingSessionLocal
+
+    monkeypatch.setattr(job_store, "async_session", TestingSessionLocal)
+    release = asyncio.Event()
+    release.set()
+    job_id = await job_store.claim_job("test", "2026:1:test")
+    job_store.start_job(job_id, _complete(job_id, release))
+    await job_store.tasks[job_id]
+
+    # A fresh process only has the persisted snapshot
+    monkeypatch.setattr(job_store, "recent_jobs", job_store.OrderedDict())
+    status = (await client.get(f"/api/scrape/status/{job_id}")).json()
+    assert status["status"] == "completed"
+    assert status["message"] == "Done"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_running_job_is_rejected(db_session, monkeypatch):
+    from fastapi import HTTPException
+    from tests.conftest import TestingSessionLocal
+
+    monkeypatch.setattr(job_store, "async_session", TestingSessionLocal)
+    release = asyncio.Event()
+    job_id = await job_store.claim_job("test", "2026:1:dup")
+    job_store.start_job(job_id, _complete(job_id, release))
+
+    with pytest.raises(HTTPException) as exc:
+        await job_store.claim_job("test", "2026:1:dup")
+    assert exc.value.status_code == 409
+
+    release.set()
+    await job_store.tasks[job_id]
+    await asyncio.sleep(0)
+    job_store.finish_job(await job_store.claim_job("test", "2026:1:dup"))
+
+
+@pytest.mark.asyncio
+async def test_failed_archive_write_does_not_fail_import(monkeypatch):
+    from datetime import datetime, timezone
+
+    from app.services import import_service
+
+    def _fail_write(*args):
+        raise OSError("disk full")
+
+    async def _import(db, season, round_num, players):
+        await asyncio.sleep(0.01)  # still importing when the write fails
+        return {"prices_set": len(players)}
+
+    monkeypatch.setattr(scrape, "_write_players_json", _fail_write)
+    monkeypatch.setattr(import_service, "import_players", _import)
+
+    result = await scrape._import_with_archive(
+        2026, 1, datetime.now(timezone.utc), [{"name": "A"}],
+    )
+    assert result == {"prices_set": 1}
+
+
+def test_history_row_matches_run_summary():
+    from datetime import datetime, timezone
+
+    from app.models.scrape_run import ScrapeRun
+
+    started = datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc)
+    run = ScrapeRun(
+        id=1, market_type="try_scorer", match_slug="a-v-b", status="completed",
+        started_at=started, completed_at=started.replace(second=30),
+        duration_seconds=None, warnings=None,
+    )
+    row = scrape._history_row(run)
+    assert row["duration_seconds"] == 30.0
+    assert row["warnings"] == []
@@ -86,15 +86,32 @@ export interface GetHistoricalClubParams {
   league?: string;
 }
 
+interface CursorPage<T> {
+  data: T[];
+  next_cursor: string | null;
+}
+
+// Historical stats are served in keyset pages; follow next_cursor to the end
+async function fetchAllPages<T>(url: string, params: object): Promise<T[]> {
+  const rows: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const response: { data: CursorPage<T> } = await api.get(url, {
+      params: { ...params, limit: 2000, cursor: cursor ?? undefined },
+    });
+    rows.push(...response.data.data);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return rows;
+}
+
 export const historicalStatsApi = {
   getSixNations: async (params: GetHistoricalSixNationsParams = {}): Promise<HistoricalSixNationsStat[]> => {
-    const response = await api.get('/api/stats/historical/six-nations', { params });
-    return response.data;
+    return fetchAllPages<HistoricalSixNationsStat>('/api/stats/historical/six-nations', params);
   },
 
   getClub: async (params: GetHistoricalClubParams = {}): Promise<HistoricalClubStat[]> => {
-    const response = await api.get('/api/stats/historical/club', { params });
-    return response.data;
+    return fetchAllPages<HistoricalClubStat>('/api/stats/historical/club', params);
   },
 
   getLeagues: async (): Promise<string[]> => {
@@ -209,12 +226,13 @@ export const scrapeApi = {
   },
 
   scrapeMarket: async (season: number, round: number, market: string): Promise<ScrapeResponse> => {
-    const response = await api.post('/api/scrape/market', { season, round, market });
+    // An explicit single-market click always re-scrapes (bypasses the recent-scrape cache)
+    const response = await api.post('/api/scrape/market', { season, round, market, force_refresh: true });
     return response.data;
   },
 
   scrapeMatchMarket: async (season: number, round: number, market: string, homeTeam: string, awayTeam: string): Promise<ScrapeResponse> => {
-    const response = await api.post('/api/scrape/match-market', { season, round, market, home_team: homeTeam, away_team: awayTeam });
+    const response = await api.post('/api/scrape/match-market', { season, round, market, home_team: homeTeam, away_team: awayTeam, force_refresh: true });
     return response.data;
   },
 
@@ -94,6 +94,7 @@ export interface PlayerStat {
 
 // Historical stats from database (rugbypy)
 export interface HistoricalSixNationsStat {
+  id: number;
   player_id: number;
   player_name: string;
   country: string;
@@ -228,6 +229,7 @@ export interface FantasyStatsMetadata {
 }
 
 export interface HistoricalClubStat {
+  id: number;
   player_id: number;
   player_name: string;
   country: string;
@@ -307,6 +309,6 @@ export interface ScrapeRunSummary {
   started_at: string;
   completed_at: string | null;
   duration_seconds: number | null;
-  warnings: any[] | null;
+  warnings: ValidationWarning[];
   result_summary: Record<string, any> | null;
 }